@@ -1,5 +1,34 @@
-import warnings
-from typing import Any, Dict, Optional, List, Union
+import asyncio
+import copy
+import gzip
+import json as _json
+import logging
+import random
+import re
+import struct
+import sys
+import time
+import weakref
+import zipfile
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from io import BytesIO
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    List,
+    Tuple,
+    Union,
+)
 
 import httpx
 from httpx._types import (
@@ -9,15 +38,220 @@ from httpx._types import (
     RequestContent,
     RequestData,
     RequestFiles,
+    URLTypes,
+)
+
+from . import errors
+from ._async_client import _EMPTY_JSON, _AsyncOrthanc
+
+try:
+    import msgspec
+except ModuleNotFoundError:
+    msgspec = None
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+if msgspec is not None:
+    _json_loads = msgspec.json.decode
+    _fast_json_dumps = msgspec.json.encode
+elif orjson is not None:
+    _json_loads = orjson.loads
+    _fast_json_dumps = orjson.dumps
+else:
+    _json_loads = _json.loads
+    _fast_json_dumps = None
+
+logger = logging.getLogger(__name__)
+
+# Transient failures worth retrying for idempotent requests
+_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+_RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.RemoteProtocolError)
+
+# Connection pool used unless `limits` is given. It is larger than the httpx
+# default (20 keep-alive connections) because traversals fan out to many
+# concurrent GETs (studies -> series -> instances), and idle connections are
+# kept longer so that the gaps of a traversal do not cost a new TCP/TLS handshake.
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=256, max_keepalive_connections=64, keepalive_expiry=60
+)
+
+# JSON bodies larger than this (in bytes) are gzipped when `compress_requests` is set
+_COMPRESS_THRESHOLD = 4096
+
+# Number of per-route GET request templates kept by a client
+_MAX_REQUEST_TEMPLATES = 1024
+
+# JSON bodies larger than this (in bytes) are decoded in a worker thread
+_THREAD_DECODE_THRESHOLD = 256 * 1024
+
+# Pre-encoded body of the empty JSON payload, the default of most POST/PUT methods
+_EMPTY_JSON_BODY = b"{}"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+# Default size (in bytes) of the chunks yielded by the streaming methods
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Media types of the bodies returned as bytes
+_BINARY_CONTENT_TYPES = (
+    "application/zip",
+    "application/dicom",
+    "application/octet-stream",
+    "image/",
+)
+
+# How long (in seconds) `get_studies_id_batched()` waits for other calls to join
+# the same `/tools/bulk-content` request
+_BATCH_DELAY = 0.01
+
+# Pending `get_studies_id_batched()` calls of an event loop, and the task answering them
+_StudyBatch = Tuple[Dict[str, asyncio.Future], asyncio.Task]
+
+# How long (in seconds) the answer of a read-only POST is reused for the same body
+_POST_CACHE_TTL = 2.0
+
+# Number of entries of the TTL cache beyond which the expired ones are purged
+_MAX_TTL_CACHE_SIZE = 4096
+
+# Size of the tail of a ZIP file holding its end records: end of central directory
+# (22 bytes + comment of up to 65535 bytes), preceded in ZIP64 files by the ZIP64
+# end of central directory record (56 bytes) and locator (20 bytes).
+_ZIP_END_STRUCT = struct.Struct("<4s4H2LH")
+_ZIP64_END_STRUCT = struct.Struct("<4sQ2H2L4Q")
+_ZIP64_LOCATOR_STRUCT = struct.Struct("<4sLQL")
+_ZIP_TAIL_SIZE = (
+    _ZIP_END_STRUCT.size + 65535 + _ZIP64_END_STRUCT.size + _ZIP64_LOCATOR_STRUCT.size
 )
 
+# Characters with a special meaning in DICOM matching (list separator and wildcards)
+_FIND_SPECIAL_CHARACTERS = frozenset("\\*?")
+
+# How long (in seconds) to wait between two polls of a job, at most
+_MAX_JOB_POLL_INTERVAL = 1.0
+
+# How long (in seconds) log levels are cached, at most (see `cache_ttl`)
+_LOG_LEVEL_CACHE_TTL = 5.0
+
+# Categories of the `/tools/log-level-*` routes
+_LOG_CATEGORIES = ("dicom", "generic", "http", "jobs", "lua", "plugins", "sqlite")
+_LOG_LEVEL_ROUTES = ("/tools/log-level",) + tuple(
+    f"/tools/log-level-{category}" for category in _LOG_CATEGORIES
+)
+
+# GET routes whose answer changes on every call, never shared between callers
+_UNCOALESCED_ROUTES = ("/tools/generate-uid", "/tools/now")
+
+# How long (in seconds) `has_study_label()` trusts a previous answer. Absent labels
+# are trusted for less time, since they are the ones a concurrent writer adds.
+_LABEL_PRESENT_TTL = 30.0
+_LABEL_ABSENT_TTL = 5.0
+
+# Near-static GET routes whose answers are reused (see `cache_ttl`), with the
+# maximum duration of their cache entries (None: `cache_ttl`). A PUT on one of
+# these routes drops its entry.
+_CACHED_GET_ROUTES: Dict[str, Optional[float]] = {
+    "/system": None,
+    "/tools": None,
+    "/tools/accepted-transfer-syntaxes": None,
+    "/tools/default-encoding": None,
+    "/tools/dicom-conformance": None,
+    "/tools/unknown-sop-class-accepted": None,
+    "/tools/log-level": _LOG_LEVEL_CACHE_TTL,
+    **{f"/tools/log-level-{c}": _LOG_LEVEL_CACHE_TTL for c in _LOG_CATEGORIES},
+}
+
+# Read-only POST routes whose answers are reused for the same payload
+_CACHED_POST_ROUTES = frozenset({"/tools/bulk-content"})
+
+# POST routes whose large JSON bodies are gzipped (see `compress_requests`)
+_COMPRESSED_ROUTES = frozenset(
+    {
+        "/tools/bulk-anonymize",
+        "/tools/bulk-content",
+        "/tools/bulk-delete",
+        "/tools/bulk-modify",
+    }
+)
+
+_STUDY_LABEL_ROUTE = re.compile(r"/studies/([^/]+)/labels/([^/]+)")
+
+
+@lru_cache(maxsize=256)
+def _encode_query(items: tuple) -> str:
+    return str(httpx.QueryParams([(key, value) for key, _, value in items]))
+
+
+def _with_query(
+    route: str, params: Optional[QueryParamTypes]
+) -> Tuple[str, Optional[QueryParamTypes]]:
+    """Append the query string of a parameter dictionary to the route
+
+    Callers tend to reuse the same parameters (e.g. `{"expand": True}`), so the
+    encoded query string is cached instead of being rebuilt by httpx on each call.
+    Parameters that cannot be cached (unhashable values, non-dict types)
+    are returned as-is.
+    """
+    if not params or not isinstance(params, dict):
+        return route, params
+
+    try:
+        # Keyed on the types too: `True == 1 == 1.0`, but they are encoded differently
+        query = _encode_query(tuple((k, type(v), v) for k, v in params.items()))
+    except TypeError:  # Unhashable values, e.g. lists
+        return route, params
+
+    return f"{route}?{query}", None
+
 
-class AsyncOrthanc(httpx.AsyncClient):
+@lru_cache(maxsize=4096)
+def _join_url(base_url: str, route: str) -> httpx.URL:
+    """Parse the absolute URL of a route
+
+    httpx would parse the relative route and then merge it into the base URL on
+    every request; parsing the absolute URL once (and caching it for the routes
+    that come back, e.g. polling) is cheaper.
+    """
+    return httpx.URL(base_url + route)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a JSON payload, with `msgspec` or `orjson` when one is installed"""
+    if _fast_json_dumps is not None:
+        try:
+            return _fast_json_dumps(obj)
+        except TypeError:
+            pass  # E.g. non-string keys, which the standard library converts
+
+    return _json.dumps(obj, separators=(",", ":")).encode()
+
+
+class AsyncOrthanc(_AsyncOrthanc):
     """Orthanc API
 
-    version 1.12.4
-    This is the full documentation of the [REST API](https://orthanc.uclouvain.be/book/users/rest.html) of Orthanc.<p>This reference is automatically generated from the source code of Orthanc. A [shorter cheat sheet](https://orthanc.uclouvain.be/book/users/rest-cheatsheet.html) is part of the Orthanc Book.<p>An earlier, manually crafted version from August 2019, is [still available](2019-08-orthanc-openapi.html), but is not up-to-date anymore ([source](https://groups.google.com/g/orthanc-users/c/NUiJTEICSl8/m/xKeqMrbqAAAJ)).
+    One method per route of the Orthanc REST API, generated from its OpenAPI
+    specification in `pyorthanc/_async_client.py` (see `scripts/generation.py`).
+    This class handles how the requests are sent (retries, connection reuse,
+    caches) and adds helpers combining several requests.
+
+    All methods share the client's connection pool. Use the client as an async
+    context manager (or call `await client.aclose()`) to close the connections:
 
+    ```python
+    async with AsyncOrthanc("http://localhost:8042") as client:
+        patients = await client.get_patients()
+    ```
+
+    The answer caches are off by default. When enabled (`cache_ttl`, `etag_cache_size`),
+    keep in mind that:
+
+    - Changes made through this client invalidate the cached answers they affect,
+      but changes made by other clients (or Orthanc's configuration) are only
+      seen once the entries expire.
+    - A cached answer is the same object for all the callers: copy it before
+      modifying it.
     """
 
     def __init__(
@@ -27,6 +261,12 @@ class AsyncOrthanc(httpx.AsyncClient):
         password: Optional[str] = None,
         return_raw_response: bool = False,
         *args,
+        max_retries: int = 3,
+        etag_cache_size: int = 0,
+        cache_ttl: float = 0,
+        compress_requests: bool = False,
+        pool_size: Optional[int] = None,
+        coalesce_requests: bool = False,
         **kwargs,
     ):
         """
@@ -40,20 +280,315 @@ class AsyncOrthanc(httpx.AsyncClient):
             Orthanc's password
         return_raw_response
             All Orthanc's methods will return a raw httpx.Response rather than the serialized result
+        max_retries
+            Number of times a GET or PUT request is retried, with exponential backoff,
+            when the connection fails or Orthanc answers 502/503/504. Set to 0 to disable.
+        etag_cache_size
+            Number of GET responses carrying an `ETag` to keep in memory (e.g. 1024).
+            Cached routes are requested again with `If-None-Match`, and a
+            `304 Not Modified` answer returns the cached (shared, do not mutate)
+            object without transferring nor decoding the body. 0 (default) disables the cache.
+        cache_ttl
+            Number of seconds during which the answers of near-static endpoints
+            (`get_system()`, `get_tools()`, `get_tools_accepted_transfer_syntaxes()`,
+            `get_tools_unknown_sop_class_accepted()`, `get_tools_default_encoding()`,
+            `get_tools_dicom_conformance()`) are reused without a request (e.g. 60).
+            Log levels (`get_tools_log_level*()`) are reused for 5 seconds at most,
+            the answers of `has_study_label()` for 30 seconds at most, and the answers
+            of `post_tools_bulk_content()` for 2 seconds for the same payload.
+            0 (default) disables the cache. See the caveats in the class documentation.
+        compress_requests
+            If `True`, the JSON bodies of the `post_tools_bulk_*()` requests larger than
+            4 KiB (e.g. thousands of identifiers in "Resources") are sent gzipped, with
+            `Content-Encoding: gzip`. Only enable this if Orthanc, or the reverse proxy
+            in front of it, decompresses request bodies.
+        pool_size
+            Maximum number of connections (all kept alive) to Orthanc, i.e. of
+            requests in flight; the others wait for a free connection. Orthanc serves
+            `HttpThreadsCount` requests at a time (50 by default), and requests
+            hitting the database contend well below that, so a value matching the
+            concurrency Orthanc sustains (often 4-16) avoids queuing on the server.
+            Shortcut for `limits=httpx.Limits(max_connections=pool_size,
+            max_keepalive_connections=pool_size, keepalive_expiry=60)`.
+        coalesce_requests
+            If `True`, concurrent calls of the same GET method without parameters
+            (e.g. `get_studies_id(id_)` for the same study) share a single request,
+            and get the same result object: copy it before modifying it. Never applies
+            when `return_raw_response` is set, nor to the routes whose answer changes
+            on every call (`/tools/generate-uid`, `/tools/now`). `False` by default.
         *args, **kwargs
-            Parameters passed to the httpx.Client (headers, timeout, etc.)
+            Parameters passed to the httpx.AsyncClient (headers, timeout, etc.). Notably:
+              limits: connection pool size, defaults to
+                `httpx.Limits(max_connections=256, max_keepalive_connections=64, keepalive_expiry=60)`
+              http2: if `True`, use HTTP/2 when the server supports it (requires the `h2` package,
+                `pip install pyorthanc[http2]`). Orthanc itself only speaks HTTP/1.1, so this
+                needs a reverse proxy (nginx, Envoy, Caddy) terminating HTTP/2 in front of it;
+                concurrent requests are then multiplexed over a single connection.
+            Responses compressed with brotli, or zstd with httpx 0.27.1 or later (e.g. by
+            a reverse proxy in front of Orthanc), are accepted and decoded when the
+            optional packages are installed (`pip install pyorthanc[compression]`):
+            httpx then advertises them in `Accept-Encoding`, next to gzip.
+        """
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be 0 or more, got {max_retries}")
+        if pool_size is not None:
+            if "limits" in kwargs:
+                raise ValueError("Only one of `pool_size` and `limits` can be given")
+            if pool_size < 1:
+                raise ValueError(f"pool_size must be at least 1, got {pool_size}")
+            kwargs["limits"] = httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=60,
+            )
+        kwargs.setdefault("limits", _DEFAULT_LIMITS)
+        # Setting the URL clears these caches
+        self._etag_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._ttl_cache: Dict[Hashable, Tuple[Any, float]] = {}
+        self._request_templates: "OrderedDict[str, httpx.Request]" = OrderedDict()
+        self._request_templates_state: Optional[tuple] = None
+        super().__init__(url, username, password, return_raw_response, *args, **kwargs)
+        self.max_retries = max_retries
+        self._etag_cache_size = etag_cache_size
+        self.cache_ttl = cache_ttl
+        self.compress_requests = compress_requests
+        self.coalesce_requests = coalesce_requests
+        self._http2 = kwargs.get("http2", False)
+        self._http_version_logged = False
+        self.event_hooks["response"].append(self._log_http_version)
+        self._inflight_gets: Dict[str, asyncio.Future] = {}
+        self._study_batches: "weakref.WeakKeyDictionary[Any, _StudyBatch]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pool_size = kwargs["limits"].max_connections
+        self._in_flight = 0
+
+    @property
+    def url(self) -> str:
+        """Orthanc server's URL"""
+        return self._url
+
+    @url.setter
+    def url(self, url: str) -> None:
+        self._url = url
+        self.base_url = url
+
+    @httpx.AsyncClient.base_url.setter
+    def base_url(self, url: URLTypes) -> None:
+        httpx.AsyncClient.base_url.fset(self, url)
+        self._base_url_str = str(self.base_url).rstrip("/")
+        # Cached answers came from the previous server
+        self._etag_cache.clear()
+        self._ttl_cache.clear()
+        self._request_templates.clear()
+
+    def _resolve_url(self, route: str) -> Union[str, httpx.URL]:
+        """Absolute URL of a route relative to the Orthanc's URL"""
+        if route.startswith("/"):
+            return _join_url(self._base_url_str, route)
+
+        return route
+
+    async def _log_http_version(self, response: httpx.Response) -> None:
+        """Log the HTTP version negotiated with the server, once
+
+        With `http2=True`, this tells whether the requests are actually multiplexed
+        (HTTP/2 is negotiated through TLS ALPN, and needs a proxy in front of Orthanc).
+        """
+        if self._http_version_logged:
+            return
+        self._http_version_logged = True
+
+        if self._http2 and response.http_version != "HTTP/2":
+            logger.warning(
+                "HTTP/2 was requested, but %s answered with %s",
+                self.url,
+                response.http_version,
+            )
+        elif response.http_version == "HTTP/2":
+            logger.info(
+                "Connected to %s with HTTP/2: requests are only multiplexed when "
+                "awaited concurrently (e.g. with `await_many()`), not one by one in a loop",
+                self.url,
+            )
+        else:
+            logger.info("Connected to %s with %s", self.url, response.http_version)
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        """Send a request (see `httpx.AsyncClient.send`), counting it while in flight"""
+        self._in_flight += 1
+        try:
+            return await super().send(request, **kwargs)
+        finally:
+            self._in_flight -= 1
+
+    def get_pool_stats(self) -> Dict[str, Optional[int]]:
+        """Usage of the connection pool
+
+        Returns
+        -------
+        Dict[str, Optional[int]]
+            "in_flight": requests sent and waiting for their response headers (or
+            for a connection), "max_connections": size of the pool (None if
+            unbounded), and "queued": requests in flight beyond the pool size.
+        """
+        queued = 0
+        if self._pool_size is not None:
+            queued = max(0, self._in_flight - self._pool_size)
+
+        return {
+            "in_flight": self._in_flight,
+            "max_connections": self._pool_size,
+            "queued": queued,
+        }
+
+    @staticmethod
+    def enable_uvloop() -> bool:
+        """Use the uvloop event loop (winloop on Windows), if it is installed
+
+        uvloop (`pip install pyorthanc[fast]`) dispatches socket events in C, which
+        lowers the event loop overhead of workloads issuing thousands of requests.
+        On Windows, where uvloop is not available, its port winloop is used instead.
+        The event loop policy is global: it applies to the loops created afterward,
+        e.g. by `asyncio.run()`.
+
+        Returns
+        -------
+        bool
+            True if uvloop (or winloop) is installed and now used, False otherwise.
+        """
+        try:
+            if sys.platform == "win32":
+                import winloop as uvloop
+            else:
+                import uvloop
+        except ModuleNotFoundError:
+            return False
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+        return True
+
+    async def _serialize_response(
+        self, response: httpx.Response
+    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
+        """Deserialize the response body according to its content type
+
+        JSON bodies are decoded with `msgspec` or `orjson` when one of these optional
+        dependencies is installed (`pip install pyorthanc[fast]`), else with the
+        standard library.
+        Large JSON bodies (e.g. `get_studies(params={"expand": True})` on a big
+        Orthanc) are decoded in a worker thread so that the event loop keeps
+        serving the other requests in flight.
+
+        Parameters
+        ----------
+        response
+            Response of the HTTP request.
+
+        Returns
+        -------
+        Union[Dict, List, str, bytes, int, httpx.Response]
+            Serialized response of the HTTP request or httpx.Response.
+        """
+        if self.return_raw_response:
+            return response
+
+        if 200 <= response.status_code < 300:
+            content_type = response.headers.get("content-type", "")
+            if content_type.startswith(_BINARY_CONTENT_TYPES):
+                # Archives, DICOM files and images: the body is never decoded
+                return response.content
+            elif "application/json" in content_type:
+                if len(response.content) > _THREAD_DECODE_THRESHOLD:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        None, _json_loads, response.content
+                    )
+
+                return _json_loads(response.content)
+            elif "text/plain" in content_type:
+                return response.text
+            else:
+                return response.content
+
+        raise httpx.HTTPError(
+            f"HTTP code: {response.status_code}, with content: {response.text}"
+        )
+
+    async def _request_with_retries(
+        self, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send an idempotent request, retrying transient failures
+
+        Failed attempts are retried `self.max_retries` times, waiting a random
+        duration between 0 and `0.05 * 4**attempt` seconds (50 ms, 200 ms, 800 ms, ...)
+        between attempts, so that the clients hitting a busy server spread out.
+
+        Parameters
+        ----------
+        method
+            HTTP method.
+        url
+            HTTP route.
+        **kwargs
+            Parameters passed to `httpx.AsyncClient.request`.
+
+        Returns
+        -------
+        httpx.Response
+            Response of the last attempt.
+        """
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+
+            try:
+                if method == "GET" and not kwargs:
+                    response = await self.send(self._build_get_request(url))
+                else:
+                    response = await self.request(
+                        method, self._resolve_url(url), **kwargs
+                    )
+            except _RETRY_EXCEPTIONS:
+                if last_attempt:
+                    raise
+            else:
+                if last_attempt or response.status_code not in _RETRY_STATUS_CODES:
+                    return response
+
+            await asyncio.sleep(random.uniform(0, 0.05 * 4**attempt))
+
+    def _build_get_request(self, route: str) -> httpx.Request:
+        """Build a GET request without parameters, cloned from a per-route template
+
+        `build_request()` merges the URL, headers, cookies and timeout of the client
+        on every call; the templates (LRU of `_MAX_REQUEST_TEMPLATES` routes) do that
+        work once. They are rebuilt when the base URL, query parameters, headers or
+        timeout of the client change, and not used while the client holds cookies.
         """
-        super().__init__(*args, **kwargs)
-        self.url = url
-        self.version = "1.12.4"
-        self.return_raw_response = return_raw_response
+        if self.cookies:
+            return self.build_request("GET", self._resolve_url(route))
 
-        if username and password:
-            self.setup_credentials(username, password)
+        state = (self.base_url, self.params, self.headers.raw, self.timeout)
+        if state != self._request_templates_state:
+            self._request_templates.clear()
+            self._request_templates_state = state
 
-    def setup_credentials(self, username: str, password: str) -> None:
-        """Set credentials needed for HTTP requests"""
-        self._auth = httpx.BasicAuth(username, password)
+        template = self._request_templates.get(route)
+        if template is None:
+            template = self.build_request("GET", self._resolve_url(route))
+            self._request_templates[route] = template
+            if len(self._request_templates) > _MAX_REQUEST_TEMPLATES:
+                self._request_templates.popitem(last=False)
+        else:
+            self._request_templates.move_to_end(route)
+
+        # Authentication adds headers to the request being sent
+        request = copy.copy(template)
+        request.headers = template.headers.copy()
+        request.extensions = dict(template.extensions)
+
+        return request
 
     async def _get(
         self,
@@ -78,25 +613,99 @@ class AsyncOrthanc(httpx.AsyncClient):
         -------
         Union[Dict, List, str, bytes, int, httpx.Response]
             Serialized response of the HTTP GET request or httpx.Response.
+            Concurrent identical requests share the same result object (see
+            `coalesce_requests`).
         """
-        response = await self.get(
-            url=route, params=params, headers=headers, cookies=cookies
-        )
+        if not params and headers is None and cookies is None:
+            if route in _CACHED_GET_ROUTES:
+                return await self._get_cached(route, _CACHED_GET_ROUTES[route])
 
-        if self.return_raw_response:
-            return response
+            return await self._get_coalesced(route)
 
-        if 200 <= response.status_code < 300:
-            if "application/json" in response.headers["content-type"]:
-                return response.json()
-            elif "text/plain" in response.headers["content-type"]:
-                return response.text
-            else:
-                return response.content
+        route, params = _with_query(route, params)
 
-        raise httpx.HTTPError(
-            f"HTTP code: {response.status_code}, with content: {response.text}"
+        return await self._send_get(route, params, headers, cookies)
+
+    async def _get_coalesced(
+        self, route: str
+    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
+        """GET request shared with the concurrent callers of the same route
+
+        Only one HTTP request is in flight per route; the callers arriving while
+        it runs await its result. Cancelling one caller does not cancel the request.
+        Raw responses are never shared, since reading one consumes it for all.
+        """
+        if (
+            not self.coalesce_requests
+            or self.return_raw_response
+            or route.startswith(_UNCOALESCED_ROUTES)
+        ):
+            return await self._send_get(route)
+
+        task = self._inflight_gets.get(route)
+
+        # A task left by a previous event loop (e.g. of another `asyncio.run()`) is stale
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._send_get(route))
+            self._inflight_gets[route] = task
+            task.add_done_callback(lambda t: self._forget_inflight_get(route, t))
+
+        return await asyncio.shield(task)
+
+    def _forget_inflight_get(self, route: str, task: asyncio.Future) -> None:
+        if self._inflight_gets.get(route) is task:
+            del self._inflight_gets[route]  # Unless already replaced by a newer one
+
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved, the callers got it (or left)
+
+    async def _send_get(
+        self,
+        route: str,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[HeaderTypes] = None,
+        cookies: Optional[CookieTypes] = None,
+    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
+        if self._etag_cache_size and headers is None and not self.return_raw_response:
+            return await self._get_with_etag(route, params, cookies)
+
+        if params is None and headers is None and cookies is None:
+            response = await self._request_with_retries("GET", route)
+        else:
+            response = await self._request_with_retries(
+                "GET", route, params=params, headers=headers, cookies=cookies
+            )
+
+        return await self._serialize_response(response)
+
+    async def _get_with_etag(
+        self,
+        route: str,
+        params: Optional[QueryParamTypes] = None,
+        cookies: Optional[CookieTypes] = None,
+    ) -> Union[Dict, List, str, bytes, int]:
+        """GET request answered from the ETag cache when Orthanc reports no change"""
+        key = (route, str(httpx.QueryParams(params)) if params else "")
+        cached = self._etag_cache.get(key)
+        headers = None if cached is None else {"If-None-Match": cached[0]}
+
+        response = await self._request_with_retries(
+            "GET", route, params=params, headers=headers, cookies=cookies
         )
+        if cached is not None and response.status_code == 304:
+            self._etag_cache.move_to_end(key)
+            return cached[1]
+
+        result = await self._serialize_response(response)
+
+        etag = response.headers.get("etag")
+        if etag is not None:
+            self._etag_cache[key] = (etag, result)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > self._etag_cache_size:
+                self._etag_cache.popitem(last=False)
+
+        return result
 
     async def _delete(
         self,
@@ -122,24 +731,17 @@ class AsyncOrthanc(httpx.AsyncClient):
         Union[Dict, List, str, bytes, int, httpx.Response]
             Serialized response of the HTTP DELETE request or httpx.Response.
         """
-        response = await self.delete(
-            route, params=params, headers=headers, cookies=cookies
+        response = await self.request(
+            "DELETE",
+            self._resolve_url(route),
+            params=params,
+            headers=headers,
+            cookies=cookies,
         )
+        result = await self._serialize_response(response)
+        self._invalidate_route(route)
 
-        if self.return_raw_response:
-            return response
-
-        if 200 <= response.status_code < 300:
-            if "application/json" in response.headers["content-type"]:
-                return response.json()
-            elif "text/plain" in response.headers["content-type"]:
-                return response.text
-            else:
-                return response.content
-
-        raise httpx.HTTPError(
-            f"HTTP code: {response.status_code}, with content: {response.text}"
-        )
+        return result
 
     async def _post(
         self,
@@ -172,31 +774,78 @@ class AsyncOrthanc(httpx.AsyncClient):
         Union[Dict, List, str, bytes, int, httpx.Response]
             Serialized response of the HTTP POST request or httpx.Response.
         """
-        response = await self.post(
-            route,
+        # httpx ignores `json` when there is another body (`data={}` and `files={}`
+        # are none), so it is never forwarded
+        if json is not None and content is None and not data and not files:
+            if (
+                route in _CACHED_POST_ROUTES
+                and params is None
+                and headers is None
+                and cookies is None
+            ):
+                return await self._post_cached(route, json)
+
+            content, headers = self._encode_json(
+                json, headers, route in _COMPRESSED_ROUTES
+            )
+
+        return await self._send_post(
+            route, content, data, files, params, headers, cookies
+        )
+
+    async def _send_post(
+        self,
+        route: str,
+        content: Optional[RequestContent] = None,
+        data: Optional[RequestData] = None,
+        files: Optional[RequestFiles] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[HeaderTypes] = None,
+        cookies: Optional[CookieTypes] = None,
+    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
+        """Send a POST request whose body is already encoded"""
+        response = await self.request(
+            "POST",
+            self._resolve_url(route),
             content=content,
             data=data,
             files=files,
-            json=json,
             params=params,
             headers=headers,
             cookies=cookies,
         )
 
-        if self.return_raw_response:
-            return response
+        return await self._serialize_response(response)
 
-        if 200 <= response.status_code < 300:
-            if "application/json" in response.headers["content-type"]:
-                return response.json()
-            elif "text/plain" in response.headers["content-type"]:
-                return response.text
-            else:
-                return response.content
+    def _encode_json(
+        self, json: Any, headers: Optional[HeaderTypes], compress: bool = False
+    ) -> Tuple[bytes, HeaderTypes]:
+        """Encode a JSON payload into a request body and its headers
 
-        raise httpx.HTTPError(
-            f"HTTP code: {response.status_code}, with text: {response.text}"
-        )
+        httpx would encode it with the standard library; `msgspec`/`orjson` are faster
+        on large payloads (e.g. thousands of identifiers in "Resources").
+        """
+        if isinstance(json, Mapping) and not json:
+            content = _EMPTY_JSON_BODY  # The default payload of most methods
+        else:
+            content = _json_dumps(json)
+
+            if (
+                compress
+                and self.compress_requests
+                and headers is None
+                and len(content) > _COMPRESS_THRESHOLD
+            ):
+                # Identifiers are hexadecimal: the fastest level gets most of the gain
+                return gzip.compress(content, compresslevel=1), _GZIP_JSON_HEADERS
+
+        if headers is None:
+            return content, _JSON_HEADERS
+
+        headers = httpx.Headers(headers)
+        headers.setdefault("Content-Type", "application/json")
+
+        return content, headers
 
     async def _put(
         self,
@@ -229,8430 +878,1268 @@ class AsyncOrthanc(httpx.AsyncClient):
         Union[Dict, List, str, bytes, int, httpx.Response]
             Serialized response of the HTTP PUT request or httpx.Response.
         """
-        response = await self.put(
-            route,
+        # As in `_post()`, `json` is either encoded here or ignored
+        if json is not None and content is None and not data and not files:
+            content, headers = self._encode_json(json, headers)
+
+        kwargs = dict(
             content=content,
             data=data,
             files=files,
-            json=json,
             params=params,
             headers=headers,
             cookies=cookies,
         )
+        if files is None and (content is None or isinstance(content, (bytes, str))):
+            # PUT is idempotent, but streamed bodies could not be sent again
+            response = await self._request_with_retries("PUT", route, **kwargs)
+        else:
+            response = await self.request("PUT", self._resolve_url(route), **kwargs)
+        result = await self._serialize_response(response)
+        self._invalidate_route(route)
 
-        if self.return_raw_response:
-            return response
-
-        if 200 <= response.status_code < 300:
-            if "application/json" in response.headers["content-type"]:
-                return response.json()
-            elif "text/plain" in response.headers["content-type"]:
-                return response.text
-            else:
-                return response.content
-
-        raise httpx.HTTPError(
-            f"HTTP code: {response.status_code}, with text: {response.text}"
-        )
+        return result
 
-    async def delete_changes(
+    async def _stream(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Clear changes
+        method: str,
+        route: str,
+        chunk_size: Optional[int] = _STREAM_CHUNK_SIZE,
+        params: Optional[QueryParamTypes] = None,
+        json: Any = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream the body of the response by chunks, without buffering it
 
-        Clear the full history stored in the changes log
-        Tags: Tracking changes
+        Parameters
+        ----------
+        method
+            HTTP method.
+        route
+            HTTP route.
+        chunk_size
+            Size of the yielded chunks, in bytes.
+        params
+            Query parameters.
+        json
+            Payload of a POST request, `{}` by default. As in `_post()`, it is
+            encoded by `_encode_json()`.
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        Yields
+        ------
+        bytes
+            Chunks of the response body.
         """
-        return await self._delete(
-            route=f"{self.url}/changes",
-        )
+        kwargs: Dict[str, Any] = {"params": params}
+        if method == "POST":
+            if json is None:
+                json = _EMPTY_JSON
+            kwargs["content"], kwargs["headers"] = self._encode_json(
+                json, None, route in _COMPRESSED_ROUTES
+            )
 
-    async def get_changes(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List changes
+        async with self._open_stream(method, route, **kwargs) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
 
-        Whenever Orthanc receives a new DICOM instance, this event is recorded in the so-called _Changes Log_. This enables remote scripts to react to the arrival of new DICOM resources. A typical application is auto-routing, where an external script waits for a new DICOM instance to arrive into Orthanc, then forward this instance to another modality.
-        Tags: Tracking changes
+    async def _stream_lines(
+        self, method: str, route: str, **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream the body of a text response line by line, without buffering it
 
         Parameters
         ----------
-        params
-            Dictionary of optional parameters:
-                "limit" (float): Limit the number of results
-                "since" (float): Show only the resources since the provided index
+        method
+            HTTP method.
+        route
+            HTTP route.
+        **kwargs
+            Parameters passed to `httpx.AsyncClient.stream` (params, json, etc.).
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The list of changes
+        Yields
+        ------
+        str
+            Lines of the response body, without their line terminator.
         """
-        return await self._get(
-            route=f"{self.url}/changes",
-            params=params,
-        )
+        async with self._open_stream(method, route, **kwargs) as response:
+            async for line in response.aiter_lines():
+                yield line
 
-    async def delete_exports(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Clear exports
+    @asynccontextmanager
+    async def _open_stream(
+        self, method: str, route: str, **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """Open a streamed response, raising if its status is not a success"""
+        async with self.stream(method, self._resolve_url(route), **kwargs) as response:
+            if not 200 <= response.status_code < 300:
+                await response.aread()
+                raise httpx.HTTPError(
+                    f"HTTP code: {response.status_code}, with content: {response.text}"
+                )
+
+            yield response
 
-        Clear the full history stored in the exports log
-        Tags: Tracking changes
+    def clear_cache(self) -> None:
+        """Forget all the cached answers (TTL and ETag caches)"""
+        self._ttl_cache.clear()
+        self._etag_cache.clear()
+
+    def _cache_get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up an unexpired entry of the TTL cache
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        Tuple[bool, Any]
+            Whether the key was found, and its value.
+        """
+        entry = self._ttl_cache.get(key)
+        if entry is None:
+            return False, None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._ttl_cache[key]
+            return False, None
+
+        return True, value
+
+    def _cache_set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value in the TTL cache for `ttl` seconds"""
+        now = time.monotonic()
+
+        if len(self._ttl_cache) >= _MAX_TTL_CACHE_SIZE:
+            # In place, the dictionary is shared with the shallow copies of the client
+            expired = [k for k, entry in self._ttl_cache.items() if entry[1] <= now]
+            for k in expired:
+                del self._ttl_cache[k]
+            while len(self._ttl_cache) >= _MAX_TTL_CACHE_SIZE:
+                del self._ttl_cache[next(iter(self._ttl_cache))]  # Oldest entry
+
+        self._ttl_cache[key] = (value, now + ttl)
+
+    def _cache_invalidate(self, key: Hashable) -> None:
+        """Drop an entry of the TTL cache, if any"""
+        self._ttl_cache.pop(key, None)
+
+    async def _get_cached(
+        self, route: str, ttl: Optional[float] = None
+    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
+        """GET a route whose answer is reused for `cache_ttl` seconds
+
+        `ttl` shortens this duration for the routes that change more often.
+        Raw responses are never cached.
         """
-        return await self._delete(
-            route=f"{self.url}/exports",
+        if self.return_raw_response or self.cache_ttl <= 0:
+            return await self._get_coalesced(route)
+
+        found, result = self._cache_get(route)
+        if found:
+            return result
+
+        result = await self._get_coalesced(route)
+        self._cache_set(
+            route, result, self.cache_ttl if ttl is None else min(ttl, self.cache_ttl)
         )
 
-    async def get_exports(
-        self,
-        params: QueryParamTypes = None,
+        return result
+
+    def _invalidate_route(self, route: str) -> None:
+        """Drop the cached answers that a PUT or DELETE on the route may change
+
+        The GET requests of these routes already in flight are not shared anymore
+        either: they may have been answered before the change.
+        """
+        if route.startswith("/tools/log-level"):
+            # A change of any log level may affect the others
+            for log_route in _LOG_LEVEL_ROUTES:
+                self._cache_invalidate(log_route)
+                self._inflight_gets.pop(log_route, None)
+        elif route in _CACHED_GET_ROUTES:
+            self._cache_invalidate(route)
+        elif route.startswith("/studies/"):
+            match = _STUDY_LABEL_ROUTE.fullmatch(route)
+            if match is not None:
+                self._cache_invalidate(("study-label", *match.groups()))
+                self._inflight_gets.pop(f"/studies/{match.group(1)}/labels", None)
+
+        self._inflight_gets.pop(route, None)
+
+    async def _post_cached(
+        self, route: str, json: Any
     ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List exports
+        """POST to a read-only route, reusing the answer to the same body for 2 seconds
+
+        Identical requests sent in a burst (e.g. by several widgets of a UI) then
+        cost a single round-trip. Raw responses are never cached.
+        """
+        key = None
+        if not self.return_raw_response and self.cache_ttl > 0:
+            try:
+                # Sorted keys, so that equal payloads built in any order share an entry
+                body = _json.dumps(
+                    json, sort_keys=True, separators=(",", ":"), default=dict
+                )
+            except (TypeError, ValueError):
+                pass  # E.g. keys of mixed types, which cannot be sorted: not cached
+            else:
+                key = (route, body)
+                found, result = self._cache_get(key)
+                if found:
+                    return result
+
+        content, headers = self._encode_json(json, None, route in _COMPRESSED_ROUTES)
+        result = await self._send_post(route, content=content, headers=headers)
+        if key is not None:
+            self._cache_set(key, result, min(_POST_CACHE_TTL, self.cache_ttl))
+
+        return result
 
-        For medical traceability, Orthanc can be configured to store a log of all the resources that have been exported to remote modalities. In auto-routing scenarios, it is important to prevent this log to grow indefinitely as incoming instances are routed. You can either disable this logging by setting the option `LogExportedResources` to `false` in the configuration file, or periodically clear this log by `DELETE`-ing this URI. This route might be removed in future versions of Orthanc.
-        Tags: Tracking changes
+    async def _gather_bounded(
+        self, coroutines: Iterable[Awaitable], limit: Optional[int] = None
+    ) -> List[Any]:
+        """Await coroutines concurrently, with at most `limit` of them in flight
 
         Parameters
         ----------
-        params
-            Dictionary of optional parameters:
-                "limit" (float): Limit the number of results
-                "since" (float): Show only the resources since the provided index
+        coroutines
+            Coroutines to await.
+        limit
+            Maximum number of coroutines awaited at the same time.
+            Defaults to the size of the connection pool.
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The list of exports
+        List[Any]
+            Results, in the order of the coroutines.
+
+        Raises
+        ------
+        ValueError
+            If `limit` is lower than 1 (nothing would ever be awaited).
         """
-        return await self._get(
-            route=f"{self.url}/exports",
-            params=params,
-        )
+        if limit is not None and limit < 1:
+            raise ValueError(f"The limit must be at least 1, got {limit}")
 
-    async def get_instances(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List the available instances
+        limit = self._pool_size if limit is None else limit
+        if limit is None:
+            return list(await asyncio.gather(*coroutines))
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(coroutine: Awaitable) -> Any:
+            async with semaphore:
+                return await coroutine
+
+        return list(await asyncio.gather(*(bounded(c) for c in coroutines)))
 
-        List the Orthanc identifiers of all the available DICOM instances
-        Tags: Instances
+    async def await_many(
+        self, coroutines: Iterable[Awaitable], limit: Optional[int] = None
+    ) -> List[Any]:
+        """(async) Await several requests concurrently
+
+        Awaiting the requests one by one in a loop costs one round-trip each, even
+        with `http2=True`. This sends them concurrently instead, over several
+        connections (HTTP/1.1) or multiplexed over one (HTTP/2).
 
         Parameters
         ----------
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual instances
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "limit" (float): Limit the number of results
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "since" (float): Show only the resources since the provided index
+        coroutines
+            Coroutines of this client's methods (or any other awaitables).
+        limit
+            Maximum number of requests in flight. Defaults to the size of the
+            connection pool (`limits.max_connections`, i.e. `pool_size` if it was
+            given, 256 by default), unbounded if `max_connections` is `None`.
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the Orthanc identifiers, or detailed information about the reported instances (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/instances",
-            params=params,
+        List[Any]
+            Results, in the order of the coroutines.
+
+        Examples
+        --------
+        ```python
+        statistics = await client.await_many(
+            client.get_studies_id_statistics(id_) for id_ in study_ids
         )
+        ```
+        """
+        return await self._gather_bounded(coroutines, limit)
 
-    async def post_instances(
+    async def map_series(
         self,
-        content: RequestContent = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Upload DICOM instances
+        ids: Iterable[str],
+        op: Callable[["AsyncOrthanc", str], Awaitable[Any]],
+    ) -> List[Any]:
+        """Apply an async operation to many series concurrently
+
+        The number of concurrent operations is bounded by the size of the
+        connection pool (`limits=httpx.Limits(max_connections=...)`, 256 by default),
+        so fanning out over a large study does not end in a `httpx.PoolTimeout`.
 
-        Upload DICOM instances
-        Tags: Instances
+        Parameters
+        ----------
+        ids
+            Orthanc identifiers of the series.
+        op
+            Coroutine function called as `op(client, id_)` for each series.
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the uploaded instance, or list of information for each uploaded instance in the case of ZIP archive
-        """
-        return await self._post(
-            route=f"{self.url}/instances",
-            content=content,
-        )
-
-    async def delete_instances_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete some instance
-
-        Delete the DICOM instance whose Orthanc identifier is provided in the URL
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/instances/{id_}",
-        )
-
-    async def get_instances_id(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get information about some instance
-
-        Get detailed information about the DICOM instance whose Orthanc identifier is provided in the URL
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM instance
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}",
-            params=params,
-        )
-
-    async def post_instances_id_anonymize(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Anonymize instance
-
-        Download an anonymized version of the DICOM instance whose Orthanc identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/anonymization.html#anonymization-of-a-single-instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        json
-            Dictionary with the following keys:
-              "DicomVersion": Version of the DICOM standard to be used for anonymization. Check out configuration option `DeidentifyLogsDicomVersion` for possible values.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": List of DICOM tags whose value must not be destroyed by the anonymization. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "KeepLabels": Keep the labels of all resources level (defaults to `false`)
-              "KeepPrivateTags": Keep the private tags from the DICOM instances (defaults to `false`)
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of additional tags to be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The anonymized DICOM instance
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/instances/{id_}/anonymize",
-            json=json,
-        )
-
-    async def get_instances_id_attachments(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List attachments
-
-        Get the list of attachments that are associated with the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        params
-            Dictionary of optional parameters:
-                "full" (str): If present, retrieve the attachments list and their numerical ids
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the attachments
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments",
-            params=params,
-        )
-
-    async def delete_instances_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete attachment
-
-        Delete an attachment associated with the given DICOM instance. This call will fail if trying to delete a system attachment (i.e. whose index is < 1024).
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/instances/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on attachments
-
-        Get the list of the operations that are available for attachments associated with the given instance
-        Tags: Other
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def put_instances_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        content: RequestContent = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set attachment
-
-        Attach a file to the given DICOM instance. This call will fail if trying to modify a system attachment (i.e. whose index is < 1024).
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        content
-                - (Content-Type: "application/octet-stream") Binary data containing the attachment
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, if this is not the first time this attachment is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._put(
-            route=f"{self.url}/instances/{id_}/attachments/{name}",
-            content=content,
-            headers=headers,
-        )
-
-    async def post_instances_id_attachments_name_compress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Compress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/compress",
-        )
-
-    async def get_instances_id_attachments_name_compressed_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment (no decompression)
-
-        Get the (binary) content of one attachment associated with the given instance. The attachment will not be decompressed if `StorageCompression` is `true`.
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/compressed-data",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name_compressed_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment on disk
-
-        Get the MD5 hash of one attachment associated with the given instance, as stored on the disk. This is different from `.../md5` iff `EnableStorage` is `true`.
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/compressed-md5",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name_compressed_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment on disk
-
-        Get the size of one attachment associated with the given instance, as stored on the disk. This is different from `.../size` iff `EnableStorage` is `true`.
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/compressed-size",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment
-
-        Get the (binary) content of one attachment associated with the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/data",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name_info(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get info about the attachment
-
-        Get all the information about the attachment associated with the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the information about the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/info",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name_is_compressed(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Is attachment compressed?
-
-        Test whether the attachment has been stored as a compressed file on the disk.
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            `0` if the attachment was stored uncompressed, `1` if it was compressed
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/is-compressed",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment
-
-        Get the MD5 hash of one attachment associated with the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/md5",
-            headers=headers,
-        )
-
-    async def get_instances_id_attachments_name_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment
-
-        Get the size of one attachment associated with the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/size",
-            headers=headers,
-        )
-
-    async def post_instances_id_attachments_name_uncompress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Uncompress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/uncompress",
-        )
-
-    async def post_instances_id_attachments_name_verify_md5(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Verify attachment
-
-        Verify that the attachment is not corrupted, by validating its MD5 hash
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            On success, a valid JSON object is returned
-        """
-        return await self._post(
-            route=f"{self.url}/instances/{id_}/attachments/{name}/verify-md5",
-        )
-
-    async def get_instances_id_content_path(
-        self,
-        id_: str,
-        path: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get raw tag
-
-        Get the raw content of one DICOM tag in the hierarchy of DICOM dataset
-        Tags: Instances
-
-        Parameters
-        ----------
-        path
-            Path to the DICOM tag. This is the interleaving of one DICOM tag, possibly followed by an index for sequences. Sequences are accessible as, for instance, `/0008-1140/1/0008-1150`
-        id_
-            Orthanc identifier of the DICOM instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The raw value of the tag of intereset (binary data, whose memory layout depends on the underlying transfer syntax), or JSON array containing the list of available tags if accessing a dataset
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/content/{path}",
-        )
-
-    async def post_instances_id_export(
-        self,
-        id_: str,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Write DICOM onto filesystem
-
-        Write the DICOM file onto the filesystem where Orthanc is running.  This is insecure for Orthanc servers that are remotely accessible since one could overwrite any system file.  Since Orthanc 1.12.0, this route is disabled by default, but can be enabled using the `RestApiWriteToFileSystemEnabled` configuration option.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        data
-            Target path on the filesystem
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/instances/{id_}/export",
-            data=data,
-        )
-
-    async def get_instances_id_file(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Download DICOM
-
-        Download one DICOM instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "transcode" (str): If present, the DICOM file will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): This HTTP header can be set to retrieve the DICOM instance in DICOMweb format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The DICOM instance
-            The DICOM instance, in DICOMweb JSON format
-            The DICOM instance, in DICOMweb XML format
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/file",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_frames(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List available frames
-
-        List the frames that are available in the DICOM instance of interest
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The list of the indices of the available frames
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames",
-        )
-
-    async def get_instances_id_frames_frame(
-        self,
-        frame: str,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations
-
-        List the available operations under URI `/instances/{id}/frames/{frame}/`
-        Tags: Other
-
-        Parameters
-        ----------
-        frame
-
-        id_
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}",
-        )
-
-    async def get_instances_id_frames_frame_image_int16(
-        self,
-        frame: float,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode a frame (int16)
-
-        Decode one frame of interest from the given DICOM instance. Pixels of grayscale images are truncated to the [-32768,32767] range. Negative values must be interpreted according to two's complement.
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/image-int16",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_frames_frame_image_uint16(
-        self,
-        frame: float,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode a frame (uint16)
-
-        Decode one frame of interest from the given DICOM instance. Pixels of grayscale images are truncated to the [0,65535] range.
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/image-uint16",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_frames_frame_image_uint8(
-        self,
-        frame: float,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode a frame (uint8)
-
-        Decode one frame of interest from the given DICOM instance. Pixels of grayscale images are truncated to the [0,255] range.
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/image-uint8",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_frames_frame_matlab(
-        self,
-        frame: float,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode frame for Matlab
-
-        Decode one frame of interest from the given DICOM instance, and export this frame as a Octave/Matlab matrix to be imported with `eval()`: https://orthanc.uclouvain.be/book/faq/matlab.html
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the DICOM instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Octave/Matlab matrix
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/matlab",
-        )
-
-    async def get_instances_id_frames_frame_numpy(
-        self,
-        frame: float,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode frame for numpy
-
-        Decode one frame of interest from the given DICOM instance, for use with numpy in Python. The numpy array has 3 dimensions: (height, width, color channel).
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the DICOM resource of interest
-        params
-            Dictionary of optional parameters:
-                "compress" (bool): Compress the file as `.npz`
-                "rescale" (bool): On grayscale images, apply the rescaling and return floating-point values
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Numpy file: https://numpy.org/devdocs/reference/generated/numpy.lib.format.html
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/numpy",
-            params=params,
-        )
-
-    async def get_instances_id_frames_frame_preview(
-        self,
-        frame: float,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode a frame (preview)
-
-        Decode one frame of interest from the given DICOM instance. The full dynamic range of grayscale images is rescaled to the [0,255] range.
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/preview",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_frames_frame_raw(
-        self,
-        frame: float,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Access raw frame
-
-        Access the raw content of one individual frame of the DICOM instance of interest, bypassing image decoding. This is notably useful to access the source files in compressed transfer syntaxes.
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The raw frame
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/raw",
-        )
-
-    async def get_instances_id_frames_frame_raw_gz(
-        self,
-        frame: float,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Access raw frame (compressed)
-
-        Access the raw content of one individual frame of the DICOM instance of interest, bypassing image decoding. This is notably useful to access the source files in compressed transfer syntaxes. The image is compressed using gzip
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The raw frame, compressed using gzip
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/raw.gz",
-        )
-
-    async def get_instances_id_frames_frame_rendered(
-        self,
-        frame: float,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Render a frame
-
-        Render one frame of interest from the given DICOM instance. This function takes scaling into account (`RescaleSlope` and `RescaleIntercept` tags), as well as the default windowing stored in the DICOM file (`WindowCenter` and `WindowWidth`tags), and can be used to resize the resulting image. Color images are not affected by windowing.
-        Tags: Instances
-
-        Parameters
-        ----------
-        frame
-            Index of the frame (starts at `0`)
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "height" (float): Height of the resized image
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-                "smooth" (bool): Whether to smooth image on resize
-                "width" (float): Width of the resized image
-                "window-center" (float): Windowing center
-                "window-width" (float): Windowing width
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/frames/{frame}/rendered",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_header(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get DICOM meta-header
-
-        Get the DICOM tags in the meta-header of the DICOM instance. By default, the `full` format is used, which combines hexadecimal tags with human-readable description.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the DICOM tags and their associated value
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/header",
-            params=params,
-        )
-
-    async def get_instances_id_image_int16(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode an image (int16)
-
-        Decode the first frame of the given DICOM instance. Pixels of grayscale images are truncated to the [-32768,32767] range. Negative values must be interpreted according to two's complement.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/image-int16",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_image_uint16(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode an image (uint16)
-
-        Decode the first frame of the given DICOM instance. Pixels of grayscale images are truncated to the [0,65535] range.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/image-uint16",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_image_uint8(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode an image (uint8)
-
-        Decode the first frame of the given DICOM instance. Pixels of grayscale images are truncated to the [0,255] range.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/image-uint8",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_labels(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List labels
-
-        Get the labels that are associated with the given instance (new in Orthanc 1.12.0)
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the labels
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/labels",
-        )
-
-    async def delete_instances_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Remove label
-
-        Remove a label associated with a instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        label
-            The label to be removed
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/instances/{id_}/labels/{label}",
-        )
-
-    async def get_instances_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Test label
-
-        Test whether the instance is associated with the given label
-        Tags: Instances
-
-        Parameters
-        ----------
-        label
-            The label of interest
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty string is returned in the case of presence, error 404 in the case of absence
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/labels/{label}",
-        )
-
-    async def put_instances_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Add label
-
-        Associate a label with a instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        label
-            The label to be added
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/instances/{id_}/labels/{label}",
-        )
-
-    async def get_instances_id_matlab(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode frame for Matlab
-
-        Decode the first frame of the given DICOM instance., and export this frame as a Octave/Matlab matrix to be imported with `eval()`: https://orthanc.uclouvain.be/book/faq/matlab.html
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Octave/Matlab matrix
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/matlab",
-        )
-
-    async def get_instances_id_metadata(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List metadata
-
-        Get the list of metadata that are associated with the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, also retrieve the value of the individual metadata
-                "numeric" (str): If present, use the numeric identifier of the metadata instead of its symbolic name
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the available metadata, or JSON associative array mapping metadata to their values (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/metadata",
-            params=params,
-        )
-
-    async def delete_instances_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete metadata
-
-        Delete some metadata associated with the given DICOM instance. This call will fail if trying to delete a system metadata (i.e. whose index is < 1024).
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/instances/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def get_instances_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get metadata
-
-        Get the value of a metadata that is associated with the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Value of the metadata
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def put_instances_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        data: RequestData = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set metadata
-
-        Set the value of some metadata in the given DICOM instance. This call will fail if trying to modify a system metadata (i.e. whose index is < 1024).
-        Tags: Instances
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the instance of interest
-        data
-            String value of the metadata
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, if this is not the first time this metadata is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/instances/{id_}/metadata/{name}",
-            data=data,
-            headers=headers,
-        )
-
-    async def post_instances_id_modify(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Modify instance
-
-        Download a modified version of the DICOM instance whose Orthanc identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/anonymization.html#modification-of-a-single-instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        json
-            Dictionary with the following keys:
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": Keep the original value of the specified tags, to be chosen among the `StudyInstanceUID`, `SeriesInstanceUID` and `SOPInstanceUID` tags. Avoid this feature as much as possible, as this breaks the DICOM model of the real world.
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of tags that must be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "RemovePrivateTags": Remove the private tags from the DICOM instances (defaults to `false`)
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The modified DICOM instance
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/instances/{id_}/modify",
-            json=json,
-        )
-
-    async def get_instances_id_module(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get instance module
-
-        Get the instance module of the DICOM instance whose Orthanc identifier is provided in the URL
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM instance
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/module",
-            params=params,
-        )
-
-    async def get_instances_id_numpy(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode instance for numpy
-
-        Decode the given DICOM instance, for use with numpy in Python. The numpy array has 4 dimensions: (frame, height, width, color channel).
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM resource of interest
-        params
-            Dictionary of optional parameters:
-                "compress" (bool): Compress the file as `.npz`
-                "rescale" (bool): On grayscale images, apply the rescaling and return floating-point values
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Numpy file: https://numpy.org/devdocs/reference/generated/numpy.lib.format.html
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/numpy",
-            params=params,
-        )
-
-    async def get_instances_id_patient(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get parent patient
-
-        Get detailed information about the parent patient of the DICOM instance whose Orthanc identifier is provided in the URL
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the parent DICOM patient
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/patient",
-            params=params,
-        )
-
-    async def get_instances_id_pdf(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get embedded PDF
-
-        Get the PDF file that is embedded in one DICOM instance. If the DICOM instance doesn't contain the `EncapsulatedDocument` tag or if the `MIMETypeOfEncapsulatedDocument` tag doesn't correspond to the PDF type, a `404` HTTP error is raised.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            PDF file
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/pdf",
-        )
-
-    async def get_instances_id_preview(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode an image (preview)
-
-        Decode the first frame of the given DICOM instance. The full dynamic range of grayscale images is rescaled to the [0,255] range.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/preview",
-            params=params,
-            headers=headers,
-        )
-
-    async def post_instances_id_reconstruct(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Reconstruct tags & optionally files of instance
-
-        Reconstruct the main DICOM tags in DB of the instance whose Orthanc identifier is provided in the URL. This is useful if child studies/series/instances have inconsistent values for higher-level tags, in order to force Orthanc to use the value from the resource of interest. Beware that this is a time-consuming operation, as all the children DICOM instances will be parsed again, and the Orthanc index will be updated accordingly.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        json
-            Dictionary with the following keys:
-              "LimitToThisLevelMainDicomTags": Only reconstruct this level MainDicomTags by re-reading them from a random child instance of the resource. This option is much faster than a full reconstruct and is usefull e.g. if you have modified the 'ExtraMainDicomTags' at the Study level to optimize the speed of some C-Find. 'false' by default. (New in Orthanc 1.12.4)
-              "ReconstructFiles": Also reconstruct the files of the resources (e.g: apply IngestTranscoding, StorageCompression). 'false' by default. (New in Orthanc 1.11.0)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/instances/{id_}/reconstruct",
-            json=json,
-        )
-
-    async def get_instances_id_rendered(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Render an image
-
-        Render the first frame of the given DICOM instance. This function takes scaling into account (`RescaleSlope` and `RescaleIntercept` tags), as well as the default windowing stored in the DICOM file (`WindowCenter` and `WindowWidth`tags), and can be used to resize the resulting image. Color images are not affected by windowing.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "height" (float): Height of the resized image
-                "quality" (float): Quality for JPEG images (between 1 and 100, defaults to 90)
-                "returnUnsupportedImage" (bool): Returns an unsupported.png placeholder image if unable to provide the image instead of returning a 415 HTTP error (defaults to false)
-                "smooth" (bool): Whether to smooth image on resize
-                "width" (float): Width of the resized image
-                "window-center" (float): Windowing center
-                "window-width" (float): Windowing width
-        headers
-            Dictionary of optional headers:
-                "Accept" (str): Format of the resulting image. Can be `image/png` (default), `image/jpeg` or `image/x-portable-arbitrarymap`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JPEG image
-            PNG image
-            PAM image (Portable Arbitrary Map)
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/rendered",
-            params=params,
-            headers=headers,
-        )
-
-    async def get_instances_id_series(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get parent series
-
-        Get detailed information about the parent series of the DICOM instance whose Orthanc identifier is provided in the URL
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the parent DICOM series
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/series",
-            params=params,
-        )
-
-    async def get_instances_id_simplified_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get human-readable tags
-
-        Get the DICOM tags in human-readable format (same as the `/instances/{id}/tags?simplify` route)
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "whole" (bool): Whether to read the whole DICOM file from the storage area (new in Orthanc 1.12.4). If set to "false" (default value), the DICOM file is read until the pixel data tag (7fe0,0010) to optimize access to storage. Setting the option to "true" provides access to the DICOM tags stored after the pixel data tag.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the DICOM tags and their associated value
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/simplified-tags",
-            params=params,
-        )
-
-    async def get_instances_id_statistics(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get instance statistics
-
-        Get statistics about the given instance
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/statistics",
-        )
-
-    async def get_instances_id_study(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get parent study
-
-        Get detailed information about the parent study of the DICOM instance whose Orthanc identifier is provided in the URL
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the instance of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the parent DICOM study
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/study",
-            params=params,
-        )
-
-    async def get_instances_id_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get DICOM tags
-
-        Get the DICOM tags in the specified format. By default, the `full` format is used, which combines hexadecimal tags with human-readable description.
-        Tags: Instances
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM instance of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-                "whole" (bool): Whether to read the whole DICOM file from the storage area (new in Orthanc 1.12.4). If set to "false" (default value), the DICOM file is read until the pixel data tag (7fe0,0010) to optimize access to storage. Setting the option to "true" provides access to the DICOM tags stored after the pixel data tag.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the DICOM tags and their associated value
-        """
-        return await self._get(
-            route=f"{self.url}/instances/{id_}/tags",
-            params=params,
-        )
-
-    async def get_jobs(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List jobs
-
-        List all the available jobs
-        Tags: Jobs
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual jobs
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the jobs identifiers, or detailed information about the reported jobs (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/jobs",
-            params=params,
-        )
-
-    async def delete_jobs_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete a job from history
-
-        Delete the job from the jobs history.  Only a completed job can be deleted. If the job has not run or not completed yet, you must cancel it first. If the job has outputs, all outputs will be deleted as well.
-        Tags: Jobs
-
-        Parameters
-        ----------
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/jobs/{id_}",
-        )
-
-    async def get_jobs_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get job
-
-        Retrieve detailed information about the job whose identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-        Tags: Jobs
-
-        Parameters
-        ----------
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object detailing the job
-        """
-        return await self._get(
-            route=f"{self.url}/jobs/{id_}",
-        )
-
-    async def post_jobs_id_cancel(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Cancel job
-
-        Cancel the job whose identifier is provided in the URL. Check out the Orthanc Book for more information about the state machine applicable to jobs: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-        Tags: Jobs
-
-        Parameters
-        ----------
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._post(
-            route=f"{self.url}/jobs/{id_}/cancel",
-        )
-
-    async def post_jobs_id_pause(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Pause job
-
-        Pause the job whose identifier is provided in the URL. Check out the Orthanc Book for more information about the state machine applicable to jobs: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-        Tags: Jobs
-
-        Parameters
-        ----------
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._post(
-            route=f"{self.url}/jobs/{id_}/pause",
-        )
-
-    async def post_jobs_id_resubmit(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Resubmit job
-
-        Resubmit the job whose identifier is provided in the URL. Check out the Orthanc Book for more information about the state machine applicable to jobs: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-        Tags: Jobs
-
-        Parameters
-        ----------
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._post(
-            route=f"{self.url}/jobs/{id_}/resubmit",
-        )
-
-    async def post_jobs_id_resume(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Resume job
-
-        Resume the job whose identifier is provided in the URL. Check out the Orthanc Book for more information about the state machine applicable to jobs: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-        Tags: Jobs
-
-        Parameters
-        ----------
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._post(
-            route=f"{self.url}/jobs/{id_}/resume",
-        )
-
-    async def delete_jobs_id_key(
-        self,
-        id_: str,
-        key: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete a job output
-
-        Delete the output produced by a job. As of Orthanc 1.12.1, only the jobs that generate a DICOMDIR media or a ZIP archive provide such an output (with `key` equals to `archive`).
-        Tags: Jobs
-
-        Parameters
-        ----------
-        key
-            Name of the output of interest
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/jobs/{id_}/{key}",
-        )
-
-    async def get_jobs_id_key(
-        self,
-        id_: str,
-        key: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get job output
-
-        Retrieve some output produced by a job. As of Orthanc 1.8.2, only the jobs that generate a DICOMDIR media or a ZIP archive provide such an output (with `key` equals to `archive`).
-        Tags: Jobs
-
-        Parameters
-        ----------
-        key
-            Name of the output of interest
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Content of the output of the job
-        """
-        return await self._get(
-            route=f"{self.url}/jobs/{id_}/{key}",
-        )
-
-    async def get_modalities(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List DICOM modalities
-
-        List all the DICOM modalities that are known to Orthanc. This corresponds either to the content of the `DicomModalities` configuration option, or to the information stored in the database if `DicomModalitiesInDatabase` is `true`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual DICOM modalities
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the identifiers of the modalities, or detailed information about the modalities (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/modalities",
-            params=params,
-        )
-
-    async def delete_modalities_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete DICOM modality
-
-        Delete one DICOM modality. This change is permanent iff. `DicomModalitiesInDatabase` is `true`, otherwise it is lost at the next restart of Orthanc.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the DICOM modality of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/modalities/{id_}",
-        )
-
-    async def get_modalities_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on modality
-
-        List the operations that are available for a DICOM modality.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the DICOM modality of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/modalities/{id_}",
-        )
-
-    async def put_modalities_id(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Update DICOM modality
-
-        Define a new DICOM modality, or update an existing one. This change is permanent iff. `DicomModalitiesInDatabase` is `true`, otherwise it is lost at the next restart of Orthanc.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the new/updated DICOM modality
-        json
-            Dictionary with the following keys:
-              "AET": AET of the remote DICOM modality
-              "AllowEcho": Whether to accept C-ECHO SCU commands issued by the remote modality
-              "AllowFind": Whether to accept C-FIND SCU commands issued by the remote modality
-              "AllowFindWorklist": Whether to accept C-FIND SCU commands for worklists issued by the remote modality
-              "AllowGet": Whether to accept C-GET SCU commands issued by the remote modality
-              "AllowMove": Whether to accept C-MOVE SCU commands issued by the remote modality
-              "AllowStorageCommitment": Whether to accept storage commitment requests issued by the remote modality
-              "AllowStore": Whether to accept C-STORE SCU commands issued by the remote modality
-              "AllowTranscoding": Whether to allow transcoding for operations initiated by this modality. This option applies to Orthanc C-GET SCP and to Orthanc C-STORE SCU. It only has an effect if the global option `EnableTranscoding` is set to `true`.
-              "Host": Host address of the remote DICOM modality (typically, an IP address)
-              "LocalAet": Whether to override the default DicomAet in the SCU connection initiated by Orthanc to this modality
-              "Manufacturer": Manufacturer of the remote DICOM modality (check configuration option `DicomModalities` for possible values
-              "Port": TCP port of the remote DICOM modality
-              "Timeout": Whether to override the default DicomScuTimeout in the SCU connection initiated by Orthanc to this modality
-              "UseDicomTls": Whether to use DICOM TLS in the SCU connection initiated by Orthanc (new in Orthanc 1.9.0)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._put(
-            route=f"{self.url}/modalities/{id_}",
-            json=json,
-        )
-
-    async def get_modalities_id_configuration(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get modality configuration
-
-        Get detailed information about the configuration of some DICOM modality
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Configuration of the modality
-        """
-        return await self._get(
-            route=f"{self.url}/modalities/{id_}/configuration",
-        )
-
-    async def post_modalities_id_echo(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Trigger C-ECHO SCU
-
-        Trigger C-ECHO SCU command against the DICOM modality whose identifier is provided in URL: https://orthanc.uclouvain.be/book/users/rest.html#performing-c-echo
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-              "CheckFind": Issue a dummy C-FIND command after the C-GET SCU, in order to check whether the remote modality knows about Orthanc. This field defaults to the value of the `DicomEchoChecksFind` configuration option. New in Orthanc 1.8.1.
-              "Timeout": Timeout for the C-ECHO command, in seconds
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/echo",
-            json=json,
-        )
-
-    async def post_modalities_id_find(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Hierarchical C-FIND SCU
-
-        Trigger a sequence of C-FIND SCU commands against the DICOM modality whose identifier is provided in URL, in order to discover a hierarchy of matching patients/studies/series. Deprecated in favor of `/modalities/{id}/query`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array describing the DICOM tags of the matching patients, embedding the matching studies, then the matching series.
-        """
-        warnings.warn("This method is deprecated.", DeprecationWarning, stacklevel=2)
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/find",
-            json=json,
-        )
-
-    async def post_modalities_id_find_instance(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) C-FIND SCU for instances
-
-        Trigger C-FIND SCU command against the DICOM modality whose identifier is provided in URL, in order to find an instance. Deprecated in favor of `/modalities/{id}/query`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array describing the DICOM tags of the matching instances
-        """
-        warnings.warn("This method is deprecated.", DeprecationWarning, stacklevel=2)
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/find-instance",
-            json=json,
-        )
-
-    async def post_modalities_id_find_patient(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) C-FIND SCU for patients
-
-        Trigger C-FIND SCU command against the DICOM modality whose identifier is provided in URL, in order to find a patient. Deprecated in favor of `/modalities/{id}/query`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array describing the DICOM tags of the matching patients
-        """
-        warnings.warn("This method is deprecated.", DeprecationWarning, stacklevel=2)
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/find-patient",
-            json=json,
-        )
-
-    async def post_modalities_id_find_series(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) C-FIND SCU for series
-
-        Trigger C-FIND SCU command against the DICOM modality whose identifier is provided in URL, in order to find a series. Deprecated in favor of `/modalities/{id}/query`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array describing the DICOM tags of the matching series
-        """
-        warnings.warn("This method is deprecated.", DeprecationWarning, stacklevel=2)
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/find-series",
-            json=json,
-        )
-
-    async def post_modalities_id_find_study(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) C-FIND SCU for studies
-
-        Trigger C-FIND SCU command against the DICOM modality whose identifier is provided in URL, in order to find a study. Deprecated in favor of `/modalities/{id}/query`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array describing the DICOM tags of the matching studies
-        """
-        warnings.warn("This method is deprecated.", DeprecationWarning, stacklevel=2)
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/find-study",
-            json=json,
-        )
-
-    async def post_modalities_id_find_worklist(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) C-FIND SCU for worklist
-
-        Trigger C-FIND SCU command against the remote worklists of the DICOM modality whose identifier is provided in URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-              "Full": If set to `true`, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-              "Query": Associative array containing the filter on the values of the DICOM tags
-              "Short": If set to `true`, report the DICOM tags in hexadecimal format
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array describing the DICOM tags of the matching worklists
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/find-worklist",
-            json=json,
-        )
-
-    async def post_modalities_id_move(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Trigger C-MOVE SCU
-
-        Start a C-MOVE SCU command as a job, in order to drive the execution of a sequence of C-STORE commands by some remote DICOM modality whose identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/rest.html#performing-c-move
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Level": Level of the query (`Patient`, `Study`, `Series` or `Instance`)
-              "LocalAet": Local AET that is used for this commands, defaults to `DicomAet` configuration option. Ignored if `DicomModalities` already sets `LocalAet` for this modality.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Resources": List of queries identifying all the DICOM resources to be sent
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "TargetAet": Target AET that will be used by the remote DICOM modality as a target for its C-STORE SCU commands, defaults to `DicomAet` configuration option in order to do a simple query/retrieve
-              "Timeout": Timeout for the C-MOVE command, in seconds
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/move",
-            json=json,
-        )
-
-    async def post_modalities_id_query(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Trigger C-FIND SCU
-
-        Trigger C-FIND SCU command against the DICOM modality whose identifier is provided in URL: https://orthanc.uclouvain.be/book/users/rest.html#performing-query-retrieve-c-find-and-find-with-rest
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-              "Level": Level of the query (`Patient`, `Study`, `Series` or `Instance`)
-              "LocalAet": Local AET that is used for this commands, defaults to `DicomAet` configuration option. Ignored if `DicomModalities` already sets `LocalAet` for this modality.
-              "Normalize": Whether to normalize the query, i.e. whether to wipe out from the query, the DICOM tags that are not applicable for the query-retrieve level of interest
-              "Query": Associative array containing the filter on the values of the DICOM tags
-              "Timeout": Timeout for the C-FIND command and subsequent C-MOVE retrievals, in seconds (new in Orthanc 1.9.1)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/query",
-            json=json,
-        )
-
-    async def post_modalities_id_storage_commitment(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Trigger storage commitment request
-
-        Trigger a storage commitment request to some remote DICOM modality whose identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/storage-commitment.html#storage-commitment-scu
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-              "DicomInstances": List of DICOM resources that are not necessarily stored within Orthanc, but that must be checked by storage commitment. This is a list of JSON objects that must contain the `SOPClassUID` and `SOPInstanceUID` fields.
-              "Resources": List of the Orthanc identifiers of the DICOM resources to be checked by storage commitment
-              "Timeout": Timeout for the storage commitment command (new in Orthanc 1.9.1)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/storage-commitment",
-            json=json,
-        )
-
-    async def post_modalities_id_store(
-        self,
-        id_: str,
-        data: RequestData = None,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Trigger C-STORE SCU
-
-        Start a C-STORE SCU command as a job, in order to send DICOM resources stored locally to some remote DICOM modality whose identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/rest.html#rest-store-scu
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "CalledAet": Called AET that is used for this commands, defaults to `AET` configuration option. Allows you to overwrite the destination AET for a specific operation.
-              "Host": Host that is used for this commands, defaults to `Host` configuration option. Allows you to overwrite the destination host for a specific operation.
-              "LocalAet": Local AET that is used for this commands, defaults to `DicomAet` configuration option. Ignored if `DicomModalities` already sets `LocalAet` for this modality.
-              "MoveOriginatorAet": Move originator AET that is used for this commands, in order to fake a C-MOVE SCU
-              "MoveOriginatorID": Move originator ID that is used for this commands, in order to fake a C-MOVE SCU
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Port": Port that is used for this command, defaults to `Port` configuration option. Allows you to overwrite the destination port for a specific operation.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Resources": List of the Orthanc identifiers of all the DICOM resources to be sent
-              "StorageCommitment": Whether to chain C-STORE with DICOM storage commitment to validate the success of the transmission: https://orthanc.uclouvain.be/book/users/storage-commitment.html#chaining-c-store-with-storage-commitment
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Timeout": Timeout for the C-STORE command, in seconds
-
-        data
-            The Orthanc identifier of one resource to be sent
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/store",
-            data=data,
-            json=json,
-        )
-
-    async def post_modalities_id_store_straight(
-        self,
-        id_: str,
-        content: RequestContent = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Straight C-STORE SCU
-
-        Synchronously send the DICOM instance in the POST body to the remote DICOM modality whose identifier is provided in URL, without having to first store it locally within Orthanc. This is an alternative to command-line tools such as `storescu` from DCMTK or dcm4che.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        content
-                - (Content-Type: "application/dicom") DICOM instance to be sent
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._post(
-            route=f"{self.url}/modalities/{id_}/store-straight",
-            content=content,
-        )
-
-    async def get_patients(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List the available patients
-
-        List the Orthanc identifiers of all the available DICOM patients
-        Tags: Patients
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual patients
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "limit" (float): Limit the number of results
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "since" (float): Show only the resources since the provided index
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the Orthanc identifiers, or detailed information about the reported patients (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/patients",
-            params=params,
-        )
-
-    async def delete_patients_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete some patient
-
-        Delete the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/patients/{id_}",
-        )
-
-    async def get_patients_id(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get information about some patient
-
-        Get detailed information about the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM patient
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}",
-            params=params,
-        )
-
-    async def post_patients_id_anonymize(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Anonymize patient
-
-        Start a job that will anonymize all the DICOM instances within the patient whose identifier is provided in the URL. The modified DICOM instances will be stored into a brand new patient, whose Orthanc identifiers will be returned by the job. https://orthanc.uclouvain.be/book/users/anonymization.html#anonymization-of-patients-studies-or-series
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "DicomVersion": Version of the DICOM standard to be used for anonymization. Check out configuration option `DeidentifyLogsDicomVersion` for possible values.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": List of DICOM tags whose value must not be destroyed by the anonymization. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "KeepLabels": Keep the labels of all resources level (defaults to `false`)
-              "KeepPrivateTags": Keep the private tags from the DICOM instances (defaults to `false`)
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of additional tags to be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/anonymize",
-            json=json,
-        )
-
-    async def get_patients_id_archive(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Synchronously create a ZIP archive containing the DICOM patient whose Orthanc identifier is provided in the URL. This flavor is synchronous, which might *not* be desirable to archive large amount of data, as it might lead to network timeouts. Prefer the asynchronous version using `POST` method.
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "filename" (str): Filename to set in the "Content-Disposition" HTTP header (including file extension)
-                "transcode" (str): If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            ZIP file containing the archive
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/archive",
-            params=params,
-        )
-
-    async def post_patients_id_archive(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Create a ZIP archive containing the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/archive",
-            json=json,
-        )
-
-    async def get_patients_id_attachments(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List attachments
-
-        Get the list of attachments that are associated with the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "full" (str): If present, retrieve the attachments list and their numerical ids
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the attachments
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments",
-            params=params,
-        )
-
-    async def delete_patients_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete attachment
-
-        Delete an attachment associated with the given DICOM patient. This call will fail if trying to delete a system attachment (i.e. whose index is < 1024).
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/patients/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on attachments
-
-        Get the list of the operations that are available for attachments associated with the given patient
-        Tags: Other
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def put_patients_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        content: RequestContent = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set attachment
-
-        Attach a file to the given DICOM patient. This call will fail if trying to modify a system attachment (i.e. whose index is < 1024).
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        content
-                - (Content-Type: "application/octet-stream") Binary data containing the attachment
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, if this is not the first time this attachment is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._put(
-            route=f"{self.url}/patients/{id_}/attachments/{name}",
-            content=content,
-            headers=headers,
-        )
-
-    async def post_patients_id_attachments_name_compress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Compress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/compress",
-        )
-
-    async def get_patients_id_attachments_name_compressed_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment (no decompression)
-
-        Get the (binary) content of one attachment associated with the given patient. The attachment will not be decompressed if `StorageCompression` is `true`.
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/compressed-data",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name_compressed_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment on disk
-
-        Get the MD5 hash of one attachment associated with the given patient, as stored on the disk. This is different from `.../md5` iff `EnableStorage` is `true`.
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/compressed-md5",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name_compressed_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment on disk
-
-        Get the size of one attachment associated with the given patient, as stored on the disk. This is different from `.../size` iff `EnableStorage` is `true`.
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/compressed-size",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment
-
-        Get the (binary) content of one attachment associated with the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/data",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name_info(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get info about the attachment
-
-        Get all the information about the attachment associated with the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the information about the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/info",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name_is_compressed(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Is attachment compressed?
-
-        Test whether the attachment has been stored as a compressed file on the disk.
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            `0` if the attachment was stored uncompressed, `1` if it was compressed
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/is-compressed",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment
-
-        Get the MD5 hash of one attachment associated with the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/md5",
-            headers=headers,
-        )
-
-    async def get_patients_id_attachments_name_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment
-
-        Get the size of one attachment associated with the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/size",
-            headers=headers,
-        )
-
-    async def post_patients_id_attachments_name_uncompress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Uncompress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/uncompress",
-        )
-
-    async def post_patients_id_attachments_name_verify_md5(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Verify attachment
-
-        Verify that the attachment is not corrupted, by validating its MD5 hash
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            On success, a valid JSON object is returned
-        """
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/attachments/{name}/verify-md5",
-        )
-
-    async def get_patients_id_instances(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get child instances
-
-        Get detailed information about the child instances of the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If false or missing, only retrieve the list of child instances
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing information about the child DICOM instances
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/instances",
-            params=params,
-        )
-
-    async def get_patients_id_instances_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get tags of instances
-
-        Get the tags of all the child instances of the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object associating the Orthanc identifiers of the instances, with the values of their DICOM tags
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/instances-tags",
-            params=params,
-        )
-
-    async def get_patients_id_labels(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List labels
-
-        Get the labels that are associated with the given patient (new in Orthanc 1.12.0)
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the labels
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/labels",
-        )
-
-    async def delete_patients_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Remove label
-
-        Remove a label associated with a patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        label
-            The label to be removed
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/patients/{id_}/labels/{label}",
-        )
-
-    async def get_patients_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Test label
-
-        Test whether the patient is associated with the given label
-        Tags: Patients
-
-        Parameters
-        ----------
-        label
-            The label of interest
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty string is returned in the case of presence, error 404 in the case of absence
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/labels/{label}",
-        )
-
-    async def put_patients_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Add label
-
-        Associate a label with a patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        label
-            The label to be added
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/patients/{id_}/labels/{label}",
-        )
-
-    async def get_patients_id_media(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Synchronously create a DICOMDIR media containing the DICOM patient whose Orthanc identifier is provided in the URL. This flavor is synchronous, which might *not* be desirable to archive large amount of data, as it might lead to network timeouts. Prefer the asynchronous version using `POST` method.
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "extended" (str): If present, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*
-                "filename" (str): Filename to set in the "Content-Disposition" HTTP header (including file extension)
-                "transcode" (str): If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            ZIP file containing the archive
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/media",
-            params=params,
-        )
-
-    async def post_patients_id_media(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Create a DICOMDIR media containing the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Extended": If `true`, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*. Default value is `false`.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/media",
-            json=json,
-        )
-
-    async def get_patients_id_metadata(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List metadata
-
-        Get the list of metadata that are associated with the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, also retrieve the value of the individual metadata
-                "numeric" (str): If present, use the numeric identifier of the metadata instead of its symbolic name
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the available metadata, or JSON associative array mapping metadata to their values (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/metadata",
-            params=params,
-        )
-
-    async def delete_patients_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete metadata
-
-        Delete some metadata associated with the given DICOM patient. This call will fail if trying to delete a system metadata (i.e. whose index is < 1024).
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/patients/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def get_patients_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get metadata
-
-        Get the value of a metadata that is associated with the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Value of the metadata
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def put_patients_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        data: RequestData = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set metadata
-
-        Set the value of some metadata in the given DICOM patient. This call will fail if trying to modify a system metadata (i.e. whose index is < 1024).
-        Tags: Patients
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the patient of interest
-        data
-            String value of the metadata
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, if this is not the first time this metadata is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/patients/{id_}/metadata/{name}",
-            data=data,
-            headers=headers,
-        )
-
-    async def post_patients_id_modify(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Modify patient
-
-        Start a job that will modify all the DICOM instances within the patient whose identifier is provided in the URL. The modified DICOM instances will be stored into a brand new patient, whose Orthanc identifiers will be returned by the job. https://orthanc.uclouvain.be/book/users/anonymization.html#modification-of-studies-or-series
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": Keep the original value of the specified tags, to be chosen among the `StudyInstanceUID`, `SeriesInstanceUID` and `SOPInstanceUID` tags. Avoid this feature as much as possible, as this breaks the DICOM model of the real world.
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of tags that must be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "RemovePrivateTags": Remove the private tags from the DICOM instances (defaults to `false`)
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/modify",
-            json=json,
-        )
-
-    async def get_patients_id_module(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get patient module
-
-        Get the patient module of the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM patient
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/module",
-            params=params,
-        )
-
-    async def get_patients_id_protected(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Is the patient protected against recycling?
-
-        Is the patient protected against recycling?
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            `1` if protected, `0` if not protected
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/protected",
-        )
-
-    async def put_patients_id_protected(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Protect/Unprotect a patient against recycling
-
-        Protects a patient by sending `1` or `true` in the payload request. Unprotects a patient by sending `0` or `false` in the payload requests. More info: https://orthanc.uclouvain.be/book/faq/features.html#recycling-protection
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/patients/{id_}/protected",
-        )
-
-    async def post_patients_id_reconstruct(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Reconstruct tags & optionally files of patient
-
-        Reconstruct the main DICOM tags in DB of the patient whose Orthanc identifier is provided in the URL. This is useful if child studies/series/instances have inconsistent values for higher-level tags, in order to force Orthanc to use the value from the resource of interest. Beware that this is a time-consuming operation, as all the children DICOM instances will be parsed again, and the Orthanc index will be updated accordingly.
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        json
-            Dictionary with the following keys:
-              "LimitToThisLevelMainDicomTags": Only reconstruct this level MainDicomTags by re-reading them from a random child instance of the resource. This option is much faster than a full reconstruct and is usefull e.g. if you have modified the 'ExtraMainDicomTags' at the Study level to optimize the speed of some C-Find. 'false' by default. (New in Orthanc 1.12.4)
-              "ReconstructFiles": Also reconstruct the files of the resources (e.g: apply IngestTranscoding, StorageCompression). 'false' by default. (New in Orthanc 1.11.0)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/patients/{id_}/reconstruct",
-            json=json,
-        )
-
-    async def get_patients_id_series(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get child series
-
-        Get detailed information about the child series of the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If false or missing, only retrieve the list of child series
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing information about the child DICOM series
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/series",
-            params=params,
-        )
-
-    async def get_patients_id_shared_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get shared tags
-
-        Extract the DICOM tags whose value is constant across all the child instances of the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the values of the DICOM tags
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/shared-tags",
-            params=params,
-        )
-
-    async def get_patients_id_statistics(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get patient statistics
-
-        Get statistics about the given patient
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/statistics",
-        )
-
-    async def get_patients_id_studies(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get child studies
-
-        Get detailed information about the child studies of the DICOM patient whose Orthanc identifier is provided in the URL
-        Tags: Patients
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the patient of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If false or missing, only retrieve the list of child studies
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing information about the child DICOM studies
-        """
-        return await self._get(
-            route=f"{self.url}/patients/{id_}/studies",
-            params=params,
-        )
-
-    async def get_peers(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List Orthanc peers
-
-        List all the Orthanc peers that are known to Orthanc. This corresponds either to the content of the `OrthancPeers` configuration option, or to the information stored in the database if `OrthancPeersInDatabase` is `true`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual Orthanc peers
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the identifiers of the peers, or detailed information about the peers (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/peers",
-            params=params,
-        )
-
-    async def delete_peers_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete Orthanc peer
-
-        Delete one Orthanc peer. This change is permanent iff. `OrthancPeersInDatabase` is `true`, otherwise it is lost at the next restart of Orthanc.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the Orthanc peer of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/peers/{id_}",
-        )
-
-    async def get_peers_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on peer
-
-        List the operations that are available for an Orthanc peer.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the peer of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/peers/{id_}",
-        )
-
-    async def put_peers_id(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Update Orthanc peer
-
-        Define a new Orthanc peer, or update an existing one. This change is permanent iff. `OrthancPeersInDatabase` is `true`, otherwise it is lost at the next restart of Orthanc.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the new/updated Orthanc peer
-        json
-            Dictionary with the following keys:
-              "CertificateFile": SSL certificate for the HTTPS connections
-              "CertificateKeyFile": Key file for the SSL certificate for the HTTPS connections
-              "CertificateKeyPassword": Key password for the SSL certificate for the HTTPS connections
-              "HttpHeaders": HTTP headers to be used for the connections to the remote peer
-              "Password": Password for the credentials
-              "URL": URL of the root of the REST API of the remote Orthanc peer, for instance `http://localhost:8042/`
-              "Username": Username for the credentials
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._put(
-            route=f"{self.url}/peers/{id_}",
-            json=json,
-        )
-
-    async def get_peers_id_configuration(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get peer configuration
-
-        Get detailed information about the configuration of some Orthanc peer
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the peer of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Configuration of the peer
-        """
-        return await self._get(
-            route=f"{self.url}/peers/{id_}/configuration",
-        )
-
-    async def post_peers_id_store(
-        self,
-        id_: str,
-        data: RequestData = None,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Send to Orthanc peer
-
-        Send DICOM resources stored locally to some remote Orthanc peer whose identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/rest.html#sending-one-resource
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Compress": Whether to compress the DICOM instances using gzip before the actual sending
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Resources": List of the Orthanc identifiers of all the DICOM resources to be sent
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode to the provided DICOM transfer syntax before the actual sending
-
-        data
-            The Orthanc identifier of one resource to be sent
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/peers/{id_}/store",
-            data=data,
-            json=json,
-        )
-
-    async def post_peers_id_store_straight(
-        self,
-        id_: str,
-        content: RequestContent = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Straight store to peer
-
-        Synchronously send the DICOM instance in the POST body to the Orthanc peer whose identifier is provided in URL, without having to first store it locally within Orthanc. This is an alternative to command-line tools such as `curl`.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the modality of interest
-        content
-                - (Content-Type: "application/dicom") DICOM instance to be sent
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._post(
-            route=f"{self.url}/peers/{id_}/store-straight",
-            content=content,
-        )
-
-    async def get_peers_id_system(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get peer system information
-
-        Get system information about some Orthanc peer. This corresponds to doing a `GET` request against the `/system` URI of the remote peer. This route can be used to test connectivity.
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the peer of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            System information about the peer
-        """
-        return await self._get(
-            route=f"{self.url}/peers/{id_}/system",
-        )
-
-    async def get_plugins(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List plugins
-
-        List all the installed plugins
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the identifiers of the installed plugins
-        """
-        return await self._get(
-            route=f"{self.url}/plugins",
-        )
-
-    async def get_plugins_explorer_js(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) JavaScript extensions to Orthanc Explorer
-
-        Get the JavaScript extensions that are installed by all the plugins using the `OrthancPluginExtendOrthancExplorer()` function of the plugin SDK. This route is for internal use of Orthanc Explorer.
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The JavaScript extensions
-        """
-        return await self._get(
-            route=f"{self.url}/plugins/explorer.js",
-        )
-
-    async def get_plugins_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get plugin
-
-        Get system information about the plugin whose identifier is provided in the URL
-        Tags: System
-
-        Parameters
-        ----------
-        id_
-            Identifier of the job of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing information about the plugin
-        """
-        return await self._get(
-            route=f"{self.url}/plugins/{id_}",
-        )
-
-    async def get_queries(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List query/retrieve operations
-
-        List the identifiers of all the query/retrieve operations on DICOM modalities, as initiated by calls to `/modalities/{id}/query`. The length of this list is bounded by the `QueryRetrieveSize` configuration option of Orthanc. https://orthanc.uclouvain.be/book/users/rest.html#performing-query-retrieve-c-find-and-find-with-rest
-        Tags: Networking
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the identifiers
-        """
-        return await self._get(
-            route=f"{self.url}/queries",
-        )
-
-    async def delete_queries_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete a query
-
-        Delete the query/retrieve operation whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the query of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/queries/{id_}",
-        )
-
-    async def get_queries_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on a query
-
-        List the available operations for the query/retrieve operation whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the query of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the list of operations
-        """
-        return await self._get(
-            route=f"{self.url}/queries/{id_}",
-        )
-
-    async def get_queries_id_answers(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List answers to a query
-
-        List the indices of all the available answers resulting from a query/retrieve operation on some DICOM modality, whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the query of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual answers
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the indices of the answers, or detailed information about the reported answers (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/queries/{id_}/answers",
-            params=params,
-        )
-
-    async def get_queries_id_answers_index(
-        self,
-        id_: str,
-        index: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on an answer
-
-        List the available operations on an answer associated with the query/retrieve operation whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        index
-            Index of the answer
-        id_
-            Identifier of the query of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the list of operations
-        """
-        return await self._get(
-            route=f"{self.url}/queries/{id_}/answers/{index}",
-        )
-
-    async def get_queries_id_answers_index_content(
-        self,
-        id_: str,
-        index: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get one answer
-
-        Get the content (DICOM tags) of one answer associated with the query/retrieve operation whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        index
-            Index of the answer
-        id_
-            Identifier of the query of interest
-        params
-            Dictionary of optional parameters:
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the DICOM tags of the answer
-        """
-        return await self._get(
-            route=f"{self.url}/queries/{id_}/answers/{index}/content",
-            params=params,
-        )
-
-    async def post_queries_id_answers_index_query_instances(
-        self,
-        id_: str,
-        index: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Query the child instances of an answer
-
-        Issue a second DICOM C-FIND operation, in order to query the child instances associated with one answer to some query/retrieve operation whose identifiers are provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        index
-            Index of the answer
-        id_
-            Identifier of the query of interest
-        json
-            Dictionary with the following keys:
-              "Query": Associative array containing the filter on the values of the DICOM tags
-              "Timeout": Timeout for the C-FIND command, in seconds (new in Orthanc 1.9.1)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/queries/{id_}/answers/{index}/query-instances",
-            json=json,
-        )
-
-    async def post_queries_id_answers_index_query_series(
-        self,
-        id_: str,
-        index: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Query the child series of an answer
-
-        Issue a second DICOM C-FIND operation, in order to query the child series associated with one answer to some query/retrieve operation whose identifiers are provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        index
-            Index of the answer
-        id_
-            Identifier of the query of interest
-        json
-            Dictionary with the following keys:
-              "Query": Associative array containing the filter on the values of the DICOM tags
-              "Timeout": Timeout for the C-FIND command, in seconds (new in Orthanc 1.9.1)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/queries/{id_}/answers/{index}/query-series",
-            json=json,
-        )
-
-    async def post_queries_id_answers_index_query_studies(
-        self,
-        id_: str,
-        index: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Query the child studies of an answer
-
-        Issue a second DICOM C-FIND operation, in order to query the child studies associated with one answer to some query/retrieve operation whose identifiers are provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        index
-            Index of the answer
-        id_
-            Identifier of the query of interest
-        json
-            Dictionary with the following keys:
-              "Query": Associative array containing the filter on the values of the DICOM tags
-              "Timeout": Timeout for the C-FIND command, in seconds (new in Orthanc 1.9.1)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/queries/{id_}/answers/{index}/query-studies",
-            json=json,
-        )
-
-    async def post_queries_id_answers_index_retrieve(
-        self,
-        id_: str,
-        index: str,
-        data: RequestData = None,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Retrieve one answer
-
-        Start a C-MOVE SCU command as a job, in order to retrieve one answer associated with the query/retrieve operation whose identifiers are provided in the URL: https://orthanc.uclouvain.be/book/users/rest.html#performing-retrieve-c-move
-        Tags: Networking
-
-        Parameters
-        ----------
-        index
-            Index of the answer
-        id_
-            Identifier of the query of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Full": If set to `true`, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Simplify": If set to `true`, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "TargetAet": AET of the target modality. By default, the AET of Orthanc is used, as defined in the `DicomAet` configuration option.
-              "Timeout": Timeout for the C-MOVE command, in seconds
-
-        data
-            AET of the target modality
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/queries/{id_}/answers/{index}/retrieve",
-            data=data,
-            json=json,
-        )
-
-    async def get_queries_id_level(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get level of original query
-
-        Get the query level (value of the `QueryRetrieveLevel` tag) of the query/retrieve operation whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the query of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The level
-        """
-        return await self._get(
-            route=f"{self.url}/queries/{id_}/level",
-        )
-
-    async def get_queries_id_modality(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get modality of original query
-
-        Get the identifier of the DICOM modality that was targeted by the query/retrieve operation whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the query of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The identifier of the DICOM modality
-        """
-        return await self._get(
-            route=f"{self.url}/queries/{id_}/modality",
-        )
-
-    async def get_queries_id_query(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get original query arguments
-
-        Get the original DICOM filter associated with the query/retrieve operation whose identifier is provided in the URL
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the query of interest
-        params
-            Dictionary of optional parameters:
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Content of the original query
-        """
-        return await self._get(
-            route=f"{self.url}/queries/{id_}/query",
-            params=params,
-        )
-
-    async def post_queries_id_retrieve(
-        self,
-        id_: str,
-        data: RequestData = None,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Retrieve all answers
-
-        Start a C-MOVE SCU command as a job, in order to retrieve all the answers associated with the query/retrieve operation whose identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/rest.html#performing-retrieve-c-move
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the query of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Full": If set to `true`, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Simplify": If set to `true`, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "TargetAet": AET of the target modality. By default, the AET of Orthanc is used, as defined in the `DicomAet` configuration option.
-              "Timeout": Timeout for the C-MOVE command, in seconds
-
-        data
-            AET of the target modality
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/queries/{id_}/retrieve",
-            data=data,
-            json=json,
-        )
-
-    async def get_series(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List the available series
-
-        List the Orthanc identifiers of all the available DICOM series
-        Tags: Series
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual series
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "limit" (float): Limit the number of results
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "since" (float): Show only the resources since the provided index
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the Orthanc identifiers, or detailed information about the reported series (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/series",
-            params=params,
-        )
-
-    async def delete_series_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete some series
-
-        Delete the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/series/{id_}",
-        )
-
-    async def get_series_id(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get information about some series
-
-        Get detailed information about the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM series
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}",
-            params=params,
-        )
-
-    async def post_series_id_anonymize(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Anonymize series
-
-        Start a job that will anonymize all the DICOM instances within the series whose identifier is provided in the URL. The modified DICOM instances will be stored into a brand new series, whose Orthanc identifiers will be returned by the job. https://orthanc.uclouvain.be/book/users/anonymization.html#anonymization-of-patients-studies-or-series
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "DicomVersion": Version of the DICOM standard to be used for anonymization. Check out configuration option `DeidentifyLogsDicomVersion` for possible values.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": List of DICOM tags whose value must not be destroyed by the anonymization. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "KeepLabels": Keep the labels of all resources level (defaults to `false`)
-              "KeepPrivateTags": Keep the private tags from the DICOM instances (defaults to `false`)
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of additional tags to be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/series/{id_}/anonymize",
-            json=json,
-        )
-
-    async def get_series_id_archive(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Synchronously create a ZIP archive containing the DICOM series whose Orthanc identifier is provided in the URL. This flavor is synchronous, which might *not* be desirable to archive large amount of data, as it might lead to network timeouts. Prefer the asynchronous version using `POST` method.
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "filename" (str): Filename to set in the "Content-Disposition" HTTP header (including file extension)
-                "transcode" (str): If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            ZIP file containing the archive
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/archive",
-            params=params,
-        )
-
-    async def post_series_id_archive(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Create a ZIP archive containing the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/series/{id_}/archive",
-            json=json,
-        )
-
-    async def get_series_id_attachments(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List attachments
-
-        Get the list of attachments that are associated with the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "full" (str): If present, retrieve the attachments list and their numerical ids
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the attachments
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments",
-            params=params,
-        )
-
-    async def delete_series_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete attachment
-
-        Delete an attachment associated with the given DICOM series. This call will fail if trying to delete a system attachment (i.e. whose index is < 1024).
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/series/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on attachments
-
-        Get the list of the operations that are available for attachments associated with the given series
-        Tags: Other
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def put_series_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        content: RequestContent = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set attachment
-
-        Attach a file to the given DICOM series. This call will fail if trying to modify a system attachment (i.e. whose index is < 1024).
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        content
-                - (Content-Type: "application/octet-stream") Binary data containing the attachment
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, if this is not the first time this attachment is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._put(
-            route=f"{self.url}/series/{id_}/attachments/{name}",
-            content=content,
-            headers=headers,
-        )
-
-    async def post_series_id_attachments_name_compress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Compress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/series/{id_}/attachments/{name}/compress",
-        )
-
-    async def get_series_id_attachments_name_compressed_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment (no decompression)
-
-        Get the (binary) content of one attachment associated with the given series. The attachment will not be decompressed if `StorageCompression` is `true`.
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/compressed-data",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name_compressed_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment on disk
-
-        Get the MD5 hash of one attachment associated with the given series, as stored on the disk. This is different from `.../md5` iff `EnableStorage` is `true`.
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/compressed-md5",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name_compressed_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment on disk
-
-        Get the size of one attachment associated with the given series, as stored on the disk. This is different from `.../size` iff `EnableStorage` is `true`.
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/compressed-size",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment
-
-        Get the (binary) content of one attachment associated with the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/data",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name_info(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get info about the attachment
-
-        Get all the information about the attachment associated with the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the information about the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/info",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name_is_compressed(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Is attachment compressed?
-
-        Test whether the attachment has been stored as a compressed file on the disk.
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            `0` if the attachment was stored uncompressed, `1` if it was compressed
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/is-compressed",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment
-
-        Get the MD5 hash of one attachment associated with the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/md5",
-            headers=headers,
-        )
-
-    async def get_series_id_attachments_name_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment
-
-        Get the size of one attachment associated with the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/attachments/{name}/size",
-            headers=headers,
-        )
-
-    async def post_series_id_attachments_name_uncompress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Uncompress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/series/{id_}/attachments/{name}/uncompress",
-        )
-
-    async def post_series_id_attachments_name_verify_md5(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Verify attachment
-
-        Verify that the attachment is not corrupted, by validating its MD5 hash
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            On success, a valid JSON object is returned
-        """
-        return await self._post(
-            route=f"{self.url}/series/{id_}/attachments/{name}/verify-md5",
-        )
-
-    async def get_series_id_instances(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get child instances
-
-        Get detailed information about the child instances of the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If false or missing, only retrieve the list of child instances
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing information about the child DICOM instances
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/instances",
-            params=params,
-        )
-
-    async def get_series_id_instances_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get tags of instances
-
-        Get the tags of all the child instances of the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object associating the Orthanc identifiers of the instances, with the values of their DICOM tags
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/instances-tags",
-            params=params,
-        )
-
-    async def get_series_id_labels(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List labels
-
-        Get the labels that are associated with the given series (new in Orthanc 1.12.0)
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the labels
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/labels",
-        )
-
-    async def delete_series_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Remove label
-
-        Remove a label associated with a series
-        Tags: Series
-
-        Parameters
-        ----------
-        label
-            The label to be removed
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/series/{id_}/labels/{label}",
-        )
-
-    async def get_series_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Test label
-
-        Test whether the series is associated with the given label
-        Tags: Series
-
-        Parameters
-        ----------
-        label
-            The label of interest
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty string is returned in the case of presence, error 404 in the case of absence
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/labels/{label}",
-        )
-
-    async def put_series_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Add label
-
-        Associate a label with a series
-        Tags: Series
-
-        Parameters
-        ----------
-        label
-            The label to be added
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/series/{id_}/labels/{label}",
-        )
-
-    async def get_series_id_media(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Synchronously create a DICOMDIR media containing the DICOM series whose Orthanc identifier is provided in the URL. This flavor is synchronous, which might *not* be desirable to archive large amount of data, as it might lead to network timeouts. Prefer the asynchronous version using `POST` method.
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "extended" (str): If present, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*
-                "filename" (str): Filename to set in the "Content-Disposition" HTTP header (including file extension)
-                "transcode" (str): If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            ZIP file containing the archive
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/media",
-            params=params,
-        )
-
-    async def post_series_id_media(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Create a DICOMDIR media containing the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Extended": If `true`, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*. Default value is `false`.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/series/{id_}/media",
-            json=json,
-        )
-
-    async def get_series_id_metadata(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List metadata
-
-        Get the list of metadata that are associated with the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, also retrieve the value of the individual metadata
-                "numeric" (str): If present, use the numeric identifier of the metadata instead of its symbolic name
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the available metadata, or JSON associative array mapping metadata to their values (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/metadata",
-            params=params,
-        )
-
-    async def delete_series_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete metadata
-
-        Delete some metadata associated with the given DICOM series. This call will fail if trying to delete a system metadata (i.e. whose index is < 1024).
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/series/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def get_series_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get metadata
-
-        Get the value of a metadata that is associated with the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Value of the metadata
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def put_series_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        data: RequestData = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set metadata
-
-        Set the value of some metadata in the given DICOM series. This call will fail if trying to modify a system metadata (i.e. whose index is < 1024).
-        Tags: Series
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the series of interest
-        data
-            String value of the metadata
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, if this is not the first time this metadata is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/series/{id_}/metadata/{name}",
-            data=data,
-            headers=headers,
-        )
-
-    async def post_series_id_modify(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Modify series
-
-        Start a job that will modify all the DICOM instances within the series whose identifier is provided in the URL. The modified DICOM instances will be stored into a brand new series, whose Orthanc identifiers will be returned by the job. https://orthanc.uclouvain.be/book/users/anonymization.html#modification-of-studies-or-series
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": Keep the original value of the specified tags, to be chosen among the `StudyInstanceUID`, `SeriesInstanceUID` and `SOPInstanceUID` tags. Avoid this feature as much as possible, as this breaks the DICOM model of the real world.
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of tags that must be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "RemovePrivateTags": Remove the private tags from the DICOM instances (defaults to `false`)
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/series/{id_}/modify",
-            json=json,
-        )
-
-    async def get_series_id_module(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get series module
-
-        Get the series module of the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM series
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/module",
-            params=params,
-        )
-
-    async def get_series_id_numpy(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Decode series for numpy
-
-        Decode the given DICOM series, for use with numpy in Python. The numpy array has 4 dimensions: (frame, height, width, color channel).
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the DICOM resource of interest
-        params
-            Dictionary of optional parameters:
-                "compress" (bool): Compress the file as `.npz`
-                "rescale" (bool): On grayscale images, apply the rescaling and return floating-point values
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Numpy file: https://numpy.org/devdocs/reference/generated/numpy.lib.format.html
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/numpy",
-            params=params,
-        )
-
-    async def get_series_id_ordered_slices(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Order the slices
-
-        Sort the instances and frames (slices) of the DICOM series whose Orthanc identifier is provided in the URL. This URI is essentially used by the Orthanc Web viewer and by the Osimis Web viewer.
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        warnings.warn("This method is deprecated.", DeprecationWarning, stacklevel=2)
-        return await self._get(
-            route=f"{self.url}/series/{id_}/ordered-slices",
-        )
-
-    async def get_series_id_patient(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get parent patient
-
-        Get detailed information about the parent patient of the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the parent DICOM patient
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/patient",
-            params=params,
-        )
-
-    async def post_series_id_reconstruct(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Reconstruct tags & optionally files of series
-
-        Reconstruct the main DICOM tags in DB of the series whose Orthanc identifier is provided in the URL. This is useful if child studies/series/instances have inconsistent values for higher-level tags, in order to force Orthanc to use the value from the resource of interest. Beware that this is a time-consuming operation, as all the children DICOM instances will be parsed again, and the Orthanc index will be updated accordingly.
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        json
-            Dictionary with the following keys:
-              "LimitToThisLevelMainDicomTags": Only reconstruct this level MainDicomTags by re-reading them from a random child instance of the resource. This option is much faster than a full reconstruct and is usefull e.g. if you have modified the 'ExtraMainDicomTags' at the Study level to optimize the speed of some C-Find. 'false' by default. (New in Orthanc 1.12.4)
-              "ReconstructFiles": Also reconstruct the files of the resources (e.g: apply IngestTranscoding, StorageCompression). 'false' by default. (New in Orthanc 1.11.0)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/series/{id_}/reconstruct",
-            json=json,
-        )
-
-    async def get_series_id_shared_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get shared tags
-
-        Extract the DICOM tags whose value is constant across all the child instances of the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the values of the DICOM tags
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/shared-tags",
-            params=params,
-        )
-
-    async def get_series_id_statistics(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get series statistics
-
-        Get statistics about the given series
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/statistics",
-        )
-
-    async def get_series_id_study(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get parent study
-
-        Get detailed information about the parent study of the DICOM series whose Orthanc identifier is provided in the URL
-        Tags: Series
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the series of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the parent DICOM study
-        """
-        return await self._get(
-            route=f"{self.url}/series/{id_}/study",
-            params=params,
-        )
-
-    async def get_statistics(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get database statistics
-
-        Get statistics related to the database of Orthanc
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._get(
-            route=f"{self.url}/statistics",
-        )
-
-    async def get_storage_commitment_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get storage commitment report
-
-        Get the storage commitment report whose identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/storage-commitment.html#storage-commitment-scu
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the storage commitment report
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._get(
-            route=f"{self.url}/storage-commitment/{id_}",
-        )
-
-    async def post_storage_commitment_id_remove(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Remove after storage commitment
-
-        Remove out of Orthanc, the DICOM instances that have been reported to have been properly received the storage commitment report whose identifier is provided in the URL. This is only possible if the `Status` of the storage commitment report is `Success`. https://orthanc.uclouvain.be/book/users/storage-commitment.html#removing-the-instances
-        Tags: Networking
-
-        Parameters
-        ----------
-        id_
-            Identifier of the storage commitment report
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/storage-commitment/{id_}/remove",
-        )
-
-    async def get_studies(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List the available studies
-
-        List the Orthanc identifiers of all the available DICOM studies
-        Tags: Studies
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, retrieve detailed information about the individual studies
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "limit" (float): Limit the number of results
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "since" (float): Show only the resources since the provided index
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the Orthanc identifiers, or detailed information about the reported studies (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/studies",
-            params=params,
-        )
-
-    async def delete_studies_id(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete some study
-
-        Delete the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/studies/{id_}",
-        )
-
-    async def get_studies_id(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get information about some study
-
-        Get detailed information about the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM study
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}",
-            params=params,
-        )
-
-    async def post_studies_id_anonymize(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Anonymize study
-
-        Start a job that will anonymize all the DICOM instances within the study whose identifier is provided in the URL. The modified DICOM instances will be stored into a brand new study, whose Orthanc identifiers will be returned by the job. https://orthanc.uclouvain.be/book/users/anonymization.html#anonymization-of-patients-studies-or-series
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "DicomVersion": Version of the DICOM standard to be used for anonymization. Check out configuration option `DeidentifyLogsDicomVersion` for possible values.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": List of DICOM tags whose value must not be destroyed by the anonymization. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "KeepLabels": Keep the labels of all resources level (defaults to `false`)
-              "KeepPrivateTags": Keep the private tags from the DICOM instances (defaults to `false`)
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of additional tags to be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/anonymize",
-            json=json,
-        )
-
-    async def get_studies_id_archive(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Synchronously create a ZIP archive containing the DICOM study whose Orthanc identifier is provided in the URL. This flavor is synchronous, which might *not* be desirable to archive large amount of data, as it might lead to network timeouts. Prefer the asynchronous version using `POST` method.
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "filename" (str): Filename to set in the "Content-Disposition" HTTP header (including file extension)
-                "transcode" (str): If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            ZIP file containing the archive
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/archive",
-            params=params,
-        )
-
-    async def post_studies_id_archive(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Create a ZIP archive containing the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/archive",
-            json=json,
-        )
-
-    async def get_studies_id_attachments(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List attachments
-
-        Get the list of attachments that are associated with the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "full" (str): If present, retrieve the attachments list and their numerical ids
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the attachments
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments",
-            params=params,
-        )
-
-    async def delete_studies_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete attachment
-
-        Delete an attachment associated with the given DICOM study. This call will fail if trying to delete a system attachment (i.e. whose index is < 1024).
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/studies/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations on attachments
-
-        Get the list of the operations that are available for attachments associated with the given study
-        Tags: Other
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}",
-            headers=headers,
-        )
-
-    async def put_studies_id_attachments_name(
-        self,
-        id_: str,
-        name: str,
-        content: RequestContent = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set attachment
-
-        Attach a file to the given DICOM study. This call will fail if trying to modify a system attachment (i.e. whose index is < 1024).
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        content
-                - (Content-Type: "application/octet-stream") Binary data containing the attachment
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the attachment, if this is not the first time this attachment is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty JSON object in the case of a success
-        """
-        return await self._put(
-            route=f"{self.url}/studies/{id_}/attachments/{name}",
-            content=content,
-            headers=headers,
-        )
-
-    async def post_studies_id_attachments_name_compress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Compress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/compress",
-        )
-
-    async def get_studies_id_attachments_name_compressed_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment (no decompression)
-
-        Get the (binary) content of one attachment associated with the given study. The attachment will not be decompressed if `StorageCompression` is `true`.
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/compressed-data",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name_compressed_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment on disk
-
-        Get the MD5 hash of one attachment associated with the given study, as stored on the disk. This is different from `.../md5` iff `EnableStorage` is `true`.
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/compressed-md5",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name_compressed_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment on disk
-
-        Get the size of one attachment associated with the given study, as stored on the disk. This is different from `.../size` iff `EnableStorage` is `true`.
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment, as stored on the disk
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/compressed-size",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name_data(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get attachment
-
-        Get the (binary) content of one attachment associated with the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The attachment
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/data",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name_info(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get info about the attachment
-
-        Get all the information about the attachment associated with the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the information about the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/info",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name_is_compressed(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Is attachment compressed?
-
-        Test whether the attachment has been stored as a compressed file on the disk.
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            `0` if the attachment was stored uncompressed, `1` if it was compressed
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/is-compressed",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name_md5(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get MD5 of attachment
-
-        Get the MD5 hash of one attachment associated with the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The MD5 of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/md5",
-            headers=headers,
-        )
-
-    async def get_studies_id_attachments_name_size(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get size of attachment
-
-        Get the size of one attachment associated with the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The size of the attachment
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/size",
-            headers=headers,
-        )
-
-    async def post_studies_id_attachments_name_uncompress(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Uncompress attachment
-
-        Change the compression scheme that is used to store an attachment.
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/uncompress",
-        )
-
-    async def post_studies_id_attachments_name_verify_md5(
-        self,
-        id_: str,
-        name: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Verify attachment
-
-        Verify that the attachment is not corrupted, by validating its MD5 hash
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the attachment, or its index (cf. `UserContentType` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            On success, a valid JSON object is returned
-        """
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/attachments/{name}/verify-md5",
-        )
-
-    async def get_studies_id_instances(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get child instances
-
-        Get detailed information about the child instances of the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If false or missing, only retrieve the list of child instances
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing information about the child DICOM instances
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/instances",
-            params=params,
-        )
-
-    async def get_studies_id_instances_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get tags of instances
-
-        Get the tags of all the child instances of the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object associating the Orthanc identifiers of the instances, with the values of their DICOM tags
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/instances-tags",
-            params=params,
-        )
-
-    async def get_studies_id_labels(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List labels
-
-        Get the labels that are associated with the given study (new in Orthanc 1.12.0)
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the labels
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/labels",
-        )
-
-    async def delete_studies_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Remove label
-
-        Remove a label associated with a study
-        Tags: Studies
-
-        Parameters
-        ----------
-        label
-            The label to be removed
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/studies/{id_}/labels/{label}",
-        )
-
-    async def get_studies_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Test label
-
-        Test whether the study is associated with the given label
-        Tags: Studies
-
-        Parameters
-        ----------
-        label
-            The label of interest
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Empty string is returned in the case of presence, error 404 in the case of absence
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/labels/{label}",
-        )
-
-    async def put_studies_id_labels_label(
-        self,
-        id_: str,
-        label: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Add label
-
-        Associate a label with a study
-        Tags: Studies
-
-        Parameters
-        ----------
-        label
-            The label to be added
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/studies/{id_}/labels/{label}",
-        )
-
-    async def get_studies_id_media(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Synchronously create a DICOMDIR media containing the DICOM study whose Orthanc identifier is provided in the URL. This flavor is synchronous, which might *not* be desirable to archive large amount of data, as it might lead to network timeouts. Prefer the asynchronous version using `POST` method.
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "extended" (str): If present, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*
-                "filename" (str): Filename to set in the "Content-Disposition" HTTP header (including file extension)
-                "transcode" (str): If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            ZIP file containing the archive
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/media",
-            params=params,
-        )
-
-    async def post_studies_id_media(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Create a DICOMDIR media containing the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Extended": If `true`, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*. Default value is `false`.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/media",
-            json=json,
-        )
-
-    async def post_studies_id_merge(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Merge study
-
-        Start a new job so as to move some DICOM resources into the DICOM study whose Orthanc identifier is provided in the URL: https://orthanc.uclouvain.be/book/users/anonymization.html#merging
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "KeepSource": If set to `true`, instructs Orthanc to keep a copy of the original resources in their source study. By default, the original resources are deleted from Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Resources": The list of DICOM resources (studies, series, and/or instances) to be merged into the study of interest (mandatory option)
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/merge",
-            json=json,
-        )
-
-    async def get_studies_id_metadata(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List metadata
-
-        Get the list of metadata that are associated with the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If present, also retrieve the value of the individual metadata
-                "numeric" (str): If present, use the numeric identifier of the metadata instead of its symbolic name
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the names of the available metadata, or JSON associative array mapping metadata to their values (if `expand` argument is provided)
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/metadata",
-            params=params,
-        )
-
-    async def delete_studies_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete metadata
-
-        Delete some metadata associated with the given DICOM study. This call will fail if trying to delete a system metadata (i.e. whose index is < 1024).
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, to check if its content has not changed and can be deleted. This header is mandatory if `CheckRevisions` option is `true`.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._delete(
-            route=f"{self.url}/studies/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def get_studies_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get metadata
-
-        Get the value of a metadata that is associated with the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        headers
-            Dictionary of optional headers:
-                "If-None-Match" (str): Optional revision of the metadata, to check if its content has changed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Value of the metadata
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/metadata/{name}",
-            headers=headers,
-        )
-
-    async def put_studies_id_metadata_name(
-        self,
-        id_: str,
-        name: str,
-        data: RequestData = None,
-        headers: HeaderTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set metadata
-
-        Set the value of some metadata in the given DICOM study. This call will fail if trying to modify a system metadata (i.e. whose index is < 1024).
-        Tags: Studies
-
-        Parameters
-        ----------
-        name
-            The name of the metadata, or its index (cf. `UserMetadata` configuration option)
-        id_
-            Orthanc identifier of the study of interest
-        data
-            String value of the metadata
-        headers
-            Dictionary of optional headers:
-                "If-Match" (str): Revision of the metadata, if this is not the first time this metadata is set.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/studies/{id_}/metadata/{name}",
-            data=data,
-            headers=headers,
-        )
-
-    async def post_studies_id_modify(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Modify study
-
-        Start a job that will modify all the DICOM instances within the study whose identifier is provided in the URL. The modified DICOM instances will be stored into a brand new study, whose Orthanc identifiers will be returned by the job. https://orthanc.uclouvain.be/book/users/anonymization.html#modification-of-studies-or-series
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": Keep the original value of the specified tags, to be chosen among the `StudyInstanceUID`, `SeriesInstanceUID` and `SOPInstanceUID` tags. Avoid this feature as much as possible, as this breaks the DICOM model of the real world.
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of tags that must be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "RemovePrivateTags": Remove the private tags from the DICOM instances (defaults to `false`)
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/modify",
-            json=json,
-        )
-
-    async def get_studies_id_module(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get study module
-
-        Get the study module of the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM study
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/module",
-            params=params,
-        )
-
-    async def get_studies_id_module_patient(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get patient module of study
-
-        Get the patient module of the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "ignore-length" (List): Also include the DICOM tags that are provided in this list, even if their associated value is long
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the DICOM study
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/module-patient",
-            params=params,
-        )
-
-    async def get_studies_id_patient(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get parent patient
-
-        Get detailed information about the parent patient of the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Information about the parent DICOM patient
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/patient",
-            params=params,
-        )
-
-    async def post_studies_id_reconstruct(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Reconstruct tags & optionally files of study
-
-        Reconstruct the main DICOM tags in DB of the study whose Orthanc identifier is provided in the URL. This is useful if child studies/series/instances have inconsistent values for higher-level tags, in order to force Orthanc to use the value from the resource of interest. Beware that this is a time-consuming operation, as all the children DICOM instances will be parsed again, and the Orthanc index will be updated accordingly.
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        json
-            Dictionary with the following keys:
-              "LimitToThisLevelMainDicomTags": Only reconstruct this level MainDicomTags by re-reading them from a random child instance of the resource. This option is much faster than a full reconstruct and is usefull e.g. if you have modified the 'ExtraMainDicomTags' at the Study level to optimize the speed of some C-Find. 'false' by default. (New in Orthanc 1.12.4)
-              "ReconstructFiles": Also reconstruct the files of the resources (e.g: apply IngestTranscoding, StorageCompression). 'false' by default. (New in Orthanc 1.11.0)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/reconstruct",
-            json=json,
-        )
-
-    async def get_studies_id_series(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get child series
-
-        Get detailed information about the child series of the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "expand" (str): If false or missing, only retrieve the list of child series
-                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing information about the child DICOM series
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/series",
-            params=params,
-        )
-
-    async def get_studies_id_shared_tags(
-        self,
-        id_: str,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get shared tags
-
-        Extract the DICOM tags whose value is constant across all the child instances of the DICOM study whose Orthanc identifier is provided in the URL
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        params
-            Dictionary of optional parameters:
-                "short" (bool): If present, report the DICOM tags in hexadecimal format
-                "simplify" (bool): If present, report the DICOM tags in human-readable format (using the symbolic name of the tags)
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON object containing the values of the DICOM tags
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/shared-tags",
-            params=params,
-        )
-
-    async def post_studies_id_split(
-        self,
-        id_: str,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Split study
-
-        Start a new job so as to split the DICOM study whose Orthanc identifier is provided in the URL, by taking some of its children series or instances out of it and putting them into a brand new study (this new study is created by setting the `StudyInstanceUID` tag to a random identifier): https://orthanc.uclouvain.be/book/users/anonymization.html#splitting
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Instances": The list of instances to be separated from the parent study. These instances must all be children of the same source study, that is specified in the URI.
-              "KeepLabels": Keep the labels of all resources level (defaults to `false`)
-              "KeepSource": If set to `true`, instructs Orthanc to keep a copy of the original series/instances in the source study. By default, the original series/instances are deleted from Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Remove": List of tags that must be removed in the new study (from the same modules as in the `Replace` option)
-              "Replace": Associative array to change the value of some DICOM tags in the new study. These tags must be part of the "Patient Module Attributes" or the "General Study Module Attributes", as specified by the DICOM 2011 standard in Tables C.7-1 and C.7-3.
-              "Series": The list of series to be separated from the parent study. These series must all be children of the same source study, that is specified in the URI.
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/studies/{id_}/split",
-            json=json,
-        )
-
-    async def get_studies_id_statistics(
-        self,
-        id_: str,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get study statistics
-
-        Get statistics about the given study
-        Tags: Studies
-
-        Parameters
-        ----------
-        id_
-            Orthanc identifier of the study of interest
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._get(
-            route=f"{self.url}/studies/{id_}/statistics",
-        )
-
-    async def get_system(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get system information
-
-        Get system information about Orthanc
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        return await self._get(
-            route=f"{self.url}/system",
-        )
-
-    async def get_tools(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) List operations
-
-        List the available operations under URI `/tools/`
-        Tags: Other
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            List of the available operations
-        """
-        return await self._get(
-            route=f"{self.url}/tools",
-        )
-
-    async def get_tools_accepted_transfer_syntaxes(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get accepted transfer syntaxes
-
-        Get the list of UIDs of the DICOM transfer syntaxes that are accepted by Orthanc C-STORE SCP. This corresponds to the configuration options `AcceptedTransferSyntaxes` and `XXXTransferSyntaxAccepted`.
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the transfer syntax UIDs
-        """
-        return await self._get(
-            route=f"{self.url}/tools/accepted-transfer-syntaxes",
-        )
-
-    async def put_tools_accepted_transfer_syntaxes(
-        self,
-        data: RequestData = None,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set accepted transfer syntaxes
-
-        Set the DICOM transfer syntaxes that accepted by Orthanc C-STORE SCP
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-
-        data
-            UID of the transfer syntax to be accepted. Wildcards `?` and `*` are accepted.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the now-accepted transfer syntax UIDs
-        """
-        if json is None:
-            json = {}
-        return await self._put(
-            route=f"{self.url}/tools/accepted-transfer-syntaxes",
-            data=data,
-            json=json,
-        )
-
-    async def post_tools_bulk_anonymize(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Anonymize a set of resources
-
-        Start a job that will anonymize all the DICOM patients, studies, series or instances whose identifiers are provided in the `Resources` field.
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "DicomVersion": Version of the DICOM standard to be used for anonymization. Check out configuration option `DeidentifyLogsDicomVersion` for possible values.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": List of DICOM tags whose value must not be destroyed by the anonymization. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "KeepLabels": Keep the labels of all resources level (defaults to `false`)
-              "KeepPrivateTags": Keep the private tags from the DICOM instances (defaults to `false`)
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of additional tags to be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Resources": List of the Orthanc identifiers of the patients/studies/series/instances of interest.
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The list of all the resources that have been created by this anonymization
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/bulk-anonymize",
-            json=json,
-        )
-
-    async def post_tools_bulk_content(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Describe a set of resources
-
-        Get the content all the DICOM patients, studies, series or instances whose identifiers are provided in the `Resources` field, in one single call.
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Full": If set to `true`, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-              "Level": This optional argument specifies the level of interest (can be `Patient`, `Study`, `Series` or `Instance`). Orthanc will loop over the items inside `Resources`, and explore upward or downward in the DICOM hierarchy in order to find the level of interest.
-              "Metadata": If set to `true` (default value), the metadata associated with the resources will also be retrieved.
-              "Resources": List of the Orthanc identifiers of the patients/studies/series/instances of interest.
-              "Short": If set to `true`, report the DICOM tags in hexadecimal format
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/bulk-content",
-            json=json,
-        )
-
-    async def post_tools_bulk_delete(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Delete a set of resources
-
-        Delete all the DICOM patients, studies, series or instances whose identifiers are provided in the `Resources` field.
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Resources": List of the Orthanc identifiers of the patients/studies/series/instances of interest.
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/bulk-delete",
-            json=json,
-        )
-
-    async def post_tools_bulk_modify(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Modify a set of resources
-
-        Start a job that will modify all the DICOM patients, studies, series or instances whose identifiers are provided in the `Resources` field.
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, run the job in asynchronous mode, which means that the REST API call will immediately return, reporting the identifier of a job. Prefer this flavor wherever possible.
-              "Force": Allow the modification of tags related to DICOM identifiers, at the risk of breaking the DICOM model of the real world
-              "Keep": Keep the original value of the specified tags, to be chosen among the `StudyInstanceUID`, `SeriesInstanceUID` and `SOPInstanceUID` tags. Avoid this feature as much as possible, as this breaks the DICOM model of the real world.
-              "KeepSource": If set to `false`, instructs Orthanc to the remove original resources. By default, the original resources are kept in Orthanc.
-              "Level": Level of the modification (`Patient`, `Study`, `Series` or `Instance`). If absent, the level defaults to `Instance`, but is set to `Patient` if `PatientID` is modified, to `Study` if `StudyInstanceUID` is modified, or to `Series` if `SeriesInstancesUID` is modified. (new in Orthanc 1.9.7)
-              "Permissive": If `true`, ignore errors during the individual steps of the job.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "PrivateCreator": The private creator to be used for private tags in `Replace`
-              "Remove": List of tags that must be removed from the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "RemovePrivateTags": Remove the private tags from the DICOM instances (defaults to `false`)
-              "Replace": Associative array to change the value of some DICOM tags in the DICOM instances. Starting with Orthanc 1.9.4, paths to subsequences can be provided using the same syntax as the `dcmodify` command-line tool (wildcards are supported as well).
-              "Resources": List of the Orthanc identifiers of the patients/studies/series/instances of interest.
-              "Synchronous": If `true`, run the job in synchronous mode, which means that the HTTP answer will directly contain the result of the job. This is the default, easy behavior, but it is *not* desirable for long jobs, as it might lead to network timeouts.
-              "Transcode": Transcode the DICOM instances to the provided DICOM transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The list of all the resources that have been altered by this modification
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/bulk-modify",
-            json=json,
-        )
-
-    async def get_tools_create_archive(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Create a ZIP archive containing the DICOM resources (patients, studies, series, or instances) whose Orthanc identifiers are provided in the 'resources' argument
-        Tags: System
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "resources" (str): A comma separated list of Orthanc resource identifiers to include in the ZIP archive.
-                "transcode" (str): If present, the DICOM files will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._get(
-            route=f"{self.url}/tools/create-archive",
-            params=params,
-        )
+        List[Any]
+            Results of `op`, in the order of `ids`.
 
-    async def post_tools_create_archive(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create ZIP archive
-
-        Create a ZIP archive containing the DICOM resources (patients, studies, series, or instances) whose Orthanc identifiers are provided in the body
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Resources": The list of Orthanc identifiers of interest.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/create-archive",
-            json=json,
-        )
-
-    async def post_tools_create_dicom(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create one DICOM instance
-
-        Create one DICOM instance, and store it into Orthanc
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Content": This field can be used to embed an image (pixel data encoded as PNG or JPEG), a PDF, or a 3D manufactoring model (MTL/OBJ/STL) inside the created DICOM instance. The file to be encapsulated must be provided using its [data URI scheme encoding](https://en.wikipedia.org/wiki/Data_URI_scheme). This field can possibly contain a JSON array, in which case a DICOM series is created containing one DICOM instance for each item in the `Content` field.
-              "Force": Avoid the consistency checks for the DICOM tags that enforce the DICOM model of the real-world. You can notably use this flag if you need to manually set the tags `StudyInstanceUID`, `SeriesInstanceUID`, or `SOPInstanceUID`. Be careful with this feature.
-              "InterpretBinaryTags": If some value in the `Tags` associative array is formatted according to some [data URI scheme encoding](https://en.wikipedia.org/wiki/Data_URI_scheme), whether this value is decoded to a binary value or kept as such (`true` by default)
-              "Parent": If present, the newly created instance will be attached to the parent DICOM resource whose Orthanc identifier is contained in this field. The DICOM tags of the parent modules in the DICOM hierarchy will be automatically copied to the newly created instance.
-              "PrivateCreator": The private creator to be used for private tags in `Tags`
-              "Tags": Associative array containing the tags of the new instance to be created
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/create-dicom",
-            json=json,
-        )
-
-    async def get_tools_create_media(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Create a DICOMDIR media containing the DICOM resources (patients, studies, series, or instances) whose Orthanc identifiers are provided in the 'resources' argument
-        Tags: System
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "resources" (str): A comma separated list of Orthanc resource identifiers to include in the DICOMDIR media.
-                "transcode" (str): If present, the DICOM files will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._get(
-            route=f"{self.url}/tools/create-media",
-            params=params,
-        )
-
-    async def post_tools_create_media(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Create a DICOMDIR media containing the DICOM resources (patients, studies, series, or instances) whose Orthanc identifiers are provided in the body
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Extended": If `true`, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*. Default value is `false`.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Resources": The list of Orthanc identifiers of interest.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/create-media",
-            json=json,
-        )
-
-    async def get_tools_create_media_extended(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Create a DICOMDIR media containing the DICOM resources (patients, studies, series, or instances) whose Orthanc identifiers are provided in the 'resources' argument
-        Tags: System
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "resources" (str): A comma separated list of Orthanc resource identifiers to include in the DICOMDIR media.
-                "transcode" (str): If present, the DICOM files will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._get(
-            route=f"{self.url}/tools/create-media-extended",
-            params=params,
-        )
-
-    async def post_tools_create_media_extended(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Create DICOMDIR media
-
-        Create a DICOMDIR media containing the DICOM resources (patients, studies, series, or instances) whose Orthanc identifiers are provided in the body
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "Asynchronous": If `true`, create the archive in asynchronous mode, which means that a job is submitted to create the archive in background.
-              "Extended": If `true`, will include additional tags such as `SeriesDescription`, leading to a so-called *extended DICOMDIR*. Default value is `true`.
-              "Priority": In asynchronous mode, the priority of the job. The lower the value, the higher the priority.
-              "Resources": The list of Orthanc identifiers of interest.
-              "Synchronous": If `true`, create the archive in synchronous mode, which means that the HTTP answer will directly contain the ZIP file. This is the default, easy behavior. However, if global configuration option "SynchronousZipStream" is set to "false", asynchronous transfers should be preferred for large amount of data, as the creation of the temporary file might lead to network timeouts.
-              "Transcode": If present, the DICOM files in the archive will be transcoded to the provided transfer syntax: https://orthanc.uclouvain.be/book/faq/transcoding.html
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            In asynchronous mode, information about the job that has been submitted to generate the archive: https://orthanc.uclouvain.be/book/users/advanced-rest.html#jobs
-            In synchronous mode, the ZIP file containing the archive
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/create-media-extended",
-            json=json,
-        )
-
-    async def get_tools_default_encoding(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get default encoding
-
-        Get the default encoding that is used by Orthanc if parsing a DICOM instance without the `SpecificCharacterEncoding` tag, or during C-FIND. This corresponds to the configuration option `DefaultEncoding`.
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The name of the encoding
-        """
-        return await self._get(
-            route=f"{self.url}/tools/default-encoding",
-        )
-
-    async def put_tools_default_encoding(
-        self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set default encoding
-
-        Change the default encoding that is used by Orthanc if parsing a DICOM instance without the `SpecificCharacterEncoding` tag, or during C-FIND. This corresponds to the configuration option `DefaultEncoding`.
-        Tags: System
-
-        Parameters
-        ----------
-        data
-            The name of the encoding. Check out configuration option `DefaultEncoding` for the allowed values.
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/tools/default-encoding",
-            data=data,
-        )
-
-    async def get_tools_dicom_conformance(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get DICOM conformance
-
-        Get the DICOM conformance statement of Orthanc
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The DICOM conformance statement
-        """
-        return await self._get(
-            route=f"{self.url}/tools/dicom-conformance",
-        )
-
-    async def post_tools_dicom_echo(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Trigger C-ECHO SCU
-
-        Trigger C-ECHO SCU command against a DICOM modality described in the POST body, without having to register the modality in some `/modalities/{id}` (new in Orthanc 1.8.1)
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "AET": AET of the remote DICOM modality
-              "CheckFind": Issue a dummy C-FIND command after the C-GET SCU, in order to check whether the remote modality knows about Orthanc. This field defaults to the value of the `DicomEchoChecksFind` configuration option. New in Orthanc 1.8.1.
-              "Host": Host address of the remote DICOM modality (typically, an IP address)
-              "LocalAet": Whether to override the default DicomAet in the SCU connection initiated by Orthanc to this modality
-              "Manufacturer": Manufacturer of the remote DICOM modality (check configuration option `DicomModalities` for possible values
-              "Port": TCP port of the remote DICOM modality
-              "Timeout": Whether to override the default DicomScuTimeout in the SCU connection initiated by Orthanc to this modality
-              "UseDicomTls": Whether to use DICOM TLS in the SCU connection initiated by Orthanc (new in Orthanc 1.9.0)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/dicom-echo",
-            json=json,
-        )
-
-    async def post_tools_execute_script(
-        self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Execute Lua script
-
-        Execute the provided Lua script by the Orthanc server. This is very insecure for Orthanc servers that are remotely accessible.  Since Orthanc 1.5.8, this route is disabled by default and can be enabled thanks to the `ExecuteLuaEnabled` configuration.
-        Tags: System
-
-        Parameters
-        ----------
-        data
-            The Lua script to be executed
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Output of the Lua script
-        """
-        return await self._post(
-            route=f"{self.url}/tools/execute-script",
-            data=data,
-        )
-
-    async def post_tools_find(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Look for local resources
-
-        This URI can be used to perform a search on the content of the local Orthanc server, in a way that is similar to querying remote DICOM modalities using C-FIND SCU: https://orthanc.uclouvain.be/book/users/rest.html#performing-finds-within-orthanc
-        Tags: System
-
-        Parameters
-        ----------
-        json
-            Dictionary with the following keys:
-              "CaseSensitive": Enable case-sensitive search for PN value representations (defaults to configuration option `CaseSensitivePN`)
-              "Expand": Also retrieve the content of the matching resources, not only their Orthanc identifiers
-              "Full": If set to `true`, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
-              "Labels": List of strings specifying which labels to look for in the resources (new in Orthanc 1.12.0)
-              "LabelsConstraint": Constraint on the labels, can be `All`, `Any`, or `None` (defaults to `All`, new in Orthanc 1.12.0)
-              "Level": Level of the query (`Patient`, `Study`, `Series` or `Instance`)
-              "Limit": Limit the number of reported resources
-              "Query": Associative array containing the filter on the values of the DICOM tags
-              "RequestedTags": A list of DICOM tags to include in the response (applicable only if "Expand" is set to true).  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return all Main Dicom Tags to keep backward compatibility with Orthanc prior to 1.11.0.
-              "Short": If set to `true`, report the DICOM tags in hexadecimal format
-              "Since": Show only the resources since the provided index (in conjunction with `Limit`)
-
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing either the Orthanc identifiers, or detailed information about the reported resources (if `Expand` argument is `true`)
-        """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/find",
-            json=json,
-        )
-
-    async def get_tools_generate_uid(
-        self,
-        params: QueryParamTypes = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Generate an identifier
-
-        Generate a random DICOM identifier
-        Tags: System
-
-        Parameters
-        ----------
-        params
-            Dictionary of optional parameters:
-                "level" (str): Type of DICOM resource among: `patient`, `study`, `series` or `instance`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The generated identifier
-        """
-        return await self._get(
-            route=f"{self.url}/tools/generate-uid_",
-            params=params,
-        )
-
-    async def post_tools_invalid_ate_tags(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Invalidate DICOM-as-JSON summaries
-
-        Remove all the attachments of the type "DICOM-as-JSON" that are associated will all the DICOM instances stored in Orthanc. These summaries will be automatically re-created on the next access. This is notably useful after changes to the `Dictionary` configuration option. https://orthanc.uclouvain.be/book/faq/orthanc-storage.html#storage-area
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._post(
-            route=f"{self.url}/tools/invalid_ate-tags",
-        )
-
-    async def get_tools_labels(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get all the used labels
-
-        List all the labels that are associated with any resource of the Orthanc database
-        Tags: System
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing the labels
-        """
-        return await self._get(
-            route=f"{self.url}/tools/labels",
-        )
-
-    async def get_tools_log_level(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get main log level
-
-        Get the main log level of Orthanc
-        Tags: Logs
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
-        """
-        return await self._get(
-            route=f"{self.url}/tools/log-level",
-        )
-
-    async def put_tools_log_level(
-        self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set main log level
-
-        Set the main log level of Orthanc
-        Tags: Logs
-
-        Parameters
-        ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/tools/log-level",
-            data=data,
+        Examples
+        --------
+        ```python
+        patients = await client.map_series(
+            series_ids, lambda client, id_: client.get_series_id_patient(id_)
         )
-
-    async def get_tools_log_level_dicom(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get log level for `dicom`
-
-        Get the log level of the log category `dicom`
-        Tags: Logs
-
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
+        ```
         """
-        return await self._get(
-            route=f"{self.url}/tools/log-level-dicom",
-        )
+        return await self._gather_bounded(op(self, id_) for id_ in ids)
 
-    async def put_tools_log_level_dicom(
-        self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set log level for `dicom`
+    async def get_many_studies_statistics(
+        self, ids: Iterable[str]
+    ) -> List[Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Get the statistics of many studies concurrently
 
-        Set the log level of the log category `dicom`
-        Tags: Logs
+        The requests overlap in flight (multiplexed over one connection with
+        `http2=True` behind an HTTP/2 proxy), so the wall-clock time is close to one
+        round-trip rather than one per study.
 
         Parameters
         ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
+        ids
+            Orthanc identifiers of the studies.
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        List[Union[Dict, List, str, bytes, int, httpx.Response]]
+            Results of `get_studies_id_statistics()`, in the order of `ids`.
         """
-        return await self._put(
-            route=f"{self.url}/tools/log-level-dicom",
-            data=data,
+        return await self._gather_bounded(
+            self.get_studies_id_statistics(id_) for id_ in ids
         )
 
-    async def get_tools_log_level_generic(
-        self,
+    async def get_studies_id_batched(
+        self, id_: str
     ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get log level for `generic`
+        """(async) Get information about some study, batched with concurrent calls
 
-        Get the log level of the log category `generic`
-        Tags: Logs
+        Same result as `get_studies_id()`, but the calls made within 10 ms of each
+        other are answered by a single `/tools/bulk-content` request, so iterating a
+        worklist concurrently costs one round-trip rather than one per study.
+
+        Parameters
+        ----------
+        id_
+            Orthanc identifier of the study of interest
 
         Returns
         -------
         Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
-        """
-        return await self._get(
-            route=f"{self.url}/tools/log-level-generic",
+            Information about the DICOM study
+
+        Examples
+        --------
+        ```python
+        studies = await asyncio.gather(
+            *(client.get_studies_id_batched(id_) for id_ in study_ids)
         )
+        ```
+        """
+        if self.return_raw_response:
+            # A single bulk response cannot be split into one response per study
+            return await self.get_studies_id(id_)
+
+        loop = asyncio.get_running_loop()
+        entry = self._study_batches.get(loop)
+        if entry is None:
+            batch: Dict[str, asyncio.Future] = {}
+            # The task is referenced until it is done, so that it is not collected
+            entry = self._study_batches[loop] = (
+                batch,
+                loop.create_task(self._flush_study_batch(batch)),
+            )
+
+        batch = entry[0]
+        future = batch.get(id_)
+        if future is None:
+            future = loop.create_future()
+            batch[id_] = future
 
-    async def put_tools_log_level_generic(
-        self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set log level for `generic`
+        # Shielded, as the future may be shared with other callers
+        return await asyncio.shield(future)
+
+    async def _flush_study_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        """Answer the pending `get_studies_id_batched()` calls"""
+        try:
+            try:
+                await asyncio.sleep(_BATCH_DELAY)
+            finally:
+                # Even if cancelled (e.g. by the shutdown of the event loop), so that
+                # the calls arriving from now on start a new batch
+                self._study_batches.pop(asyncio.get_running_loop(), None)
+
+            if len(batch) > 1:
+                try:
+                    contents = await self.post_tools_bulk_content(
+                        {"Resources": list(batch), "Level": "Study", "Metadata": False}
+                    )
+                except httpx.HTTPError:
+                    # E.g. an unknown study fails the whole batch; the studies are
+                    # requested one by one below so that only that call fails.
+                    contents = []
+
+                by_id = {content["ID"]: content for content in contents}
+                if by_id.keys() >= batch.keys():
+                    for id_, future in batch.items():
+                        future.set_result(by_id[id_])
+                    return
 
-        Set the log level of the log category `generic`
-        Tags: Logs
+            results = await asyncio.gather(
+                *(self.get_studies_id(id_) for id_ in batch), return_exceptions=True
+            )
+            for future, result in zip(batch.values(), results):
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+
+    async def post_tools_bulk_delete_parallel(
+        self, resources: List[str], chunks: int = 8
+    ) -> List[Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Delete a set of resources with several concurrent requests
+
+        `resources` is split into `chunks` parts deleted concurrently by as many
+        `post_tools_bulk_delete()` calls, so that Orthanc can spread the work over
+        its threads instead of deleting the resources one after the other.
 
         Parameters
         ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
+        resources
+            Orthanc identifiers of the patients/studies/series/instances to delete
+        chunks
+            Number of concurrent `post_tools_bulk_delete()` calls
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        List[Union[Dict, List, str, bytes, int, httpx.Response]]
+            Results of `post_tools_bulk_delete()`, one per chunk
+
+        Raises
+        ------
+        ValueError
+            If `chunks` is lower than 1.
         """
-        return await self._put(
-            route=f"{self.url}/tools/log-level-generic",
-            data=data,
+        if chunks < 1:
+            raise ValueError(f"The number of chunks must be at least 1, got {chunks}")
+
+        size = max(1, -(-len(resources) // chunks))  # Ceiling division
+        parts = [resources[i : i + size] for i in range(0, len(resources), size)]
+
+        return await self._gather_bounded(
+            self.post_tools_bulk_delete({"Resources": part}) for part in parts
         )
 
-    async def get_tools_log_level_http(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get log level for `http`
+    async def post_tools_find_batch(
+        self, queries: Iterable[Any], concurrency: int = 16
+    ) -> List[Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Run several `/tools/find` queries concurrently
 
-        Get the log level of the log category `http`
-        Tags: Logs
+        Parameters
+        ----------
+        queries
+            Payloads of `post_tools_find()`
+        concurrency
+            Maximum number of queries in flight (e.g. below the maximum number of
+            concurrent streams of an HTTP/2 proxy)
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
+        List[Union[Dict, List, str, bytes, int, httpx.Response]]
+            Results of `post_tools_find()`, in the order of `queries`.
         """
-        return await self._get(
-            route=f"{self.url}/tools/log-level-http",
+        return await self._gather_bounded(
+            (self.post_tools_find(query) for query in queries), concurrency
         )
 
-    async def put_tools_log_level_http(
+    async def post_tools_find_many(
         self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set log level for `http`
+        key: str,
+        values: Iterable[str],
+        level: str = "Study",
+        page_size: int = 1000,
+    ) -> Dict[str, List[Dict]]:
+        """(async) Look for the local resources matching any of several tag values
 
-        Set the log level of the log category `http`
-        Tags: Logs
+        A single `/tools/find` request matches all the values at once (DICOM list
+        matching, `value1\\value2\\...`), instead of one request per value.
+        The resources are then grouped by the value they matched.
+
+        The results are requested by pages of `page_size` resources ("Limit" and
+        "Since"), the next page being requested as long as a page is full. If
+        Orthanc's `LimitFindResults` option is set, `page_size` must not exceed it:
+        Orthanc would otherwise return truncated pages, taken for the last one.
 
         Parameters
         ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
+        key
+            DICOM tag to match, by name or as "gggg,eeee", e.g. "StudyInstanceUID"
+            or "0020,000D"
+        values
+            Exact values to look for
+        level
+            Level of the query (`Patient`, `Study`, `Series` or `Instance`)
+        page_size
+            Maximum number of resources per request
+
+        Returns
+        -------
+        Dict[str, List[Dict]]
+            Content of the matching resources (as with "Expand"), for each value.
+            Values without match are mapped to an empty list.
+
+        Raises
+        ------
+        ValueError
+            If a value contains a wildcard (`*`, `?`) or a backslash, which would
+            change the meaning of the query, or if `page_size` is lower than 1.
+
+        Examples
+        --------
+        ```python
+        studies = await client.post_tools_find_many(
+            "StudyInstanceUID", ["1.2.3", "1.2.4"]
+        )
+        studies["1.2.3"]  # [{"ID": ..., "MainDicomTags": ..., ...}]
+        ```
+        """
+        if page_size < 1:
+            raise ValueError(f"The page size must be at least 1, got {page_size}")
+
+        matches: Dict[str, List[Dict]] = {value: [] for value in values}
+        for value in matches:
+            if not _FIND_SPECIAL_CHARACTERS.isdisjoint(value):
+                raise ValueError(
+                    f"Wildcards and backslashes are not supported: {value!r}"
+                )
+        if not matches:
+            return matches
+
+        client = self
+        if self.return_raw_response:
+            client = copy.copy(self)
+            client.return_raw_response = False
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-        """
-        return await self._put(
-            route=f"{self.url}/tools/log-level-http",
-            data=data,
-        )
+        query = {
+            "Level": level,
+            "Query": {key: "\\".join(matches)},
+            "Expand": True,
+            "RequestedTags": [key],
+            "Limit": page_size,
+        }
+        since = 0
+        while True:
+            resources = await client.post_tools_find({**query, "Since": since})
+            for resource in resources:
+                # The only requested tag, named by Orthanc even if `key` is "gggg,eeee"
+                value = next(iter(resource["RequestedTags"].values()), None)
+                if value in matches:
+                    matches[value].append(resource)
+
+            if len(resources) < page_size:
+                break
+            since += len(resources)
+
+        return matches
 
-    async def get_tools_log_level_jobs(
+    async def get_tools_snapshot(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get log level for `jobs`
+    ) -> Dict[str, Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Get a snapshot of the state exposed under `/tools/`
 
-        Get the log level of the log category `jobs`
-        Tags: Logs
+        The requests are sent concurrently, so this costs about one round-trip
+        instead of one per value (and a single connection with `http2=True`
+        behind an HTTP/2 proxy).
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
+        Dict[str, Union[Dict, List, str, bytes, int, httpx.Response]]
+            Dictionary with the "now", "default_encoding", "labels", "metrics",
+            "accepted_transfer_syntaxes", "unknown_sop_class_accepted", "log_level"
+            and "log_level_<category>" keys (categories: dicom, generic, http, jobs,
+            lua, plugins, sqlite)
         """
-        return await self._get(
-            route=f"{self.url}/tools/log-level-jobs",
-        )
+        requests = {
+            "now": self.get_tools_now(),
+            "default_encoding": self.get_tools_default_encoding(),
+            "labels": self.get_tools_labels(),
+            "metrics": self.get_tools_metrics(),
+            "accepted_transfer_syntaxes": self.get_tools_accepted_transfer_syntaxes(),
+            "unknown_sop_class_accepted": self.get_tools_unknown_sop_class_accepted(),
+            "log_level": self.get_tools_log_level(),
+        }
+        for category in _LOG_CATEGORIES:
+            requests[f"log_level_{category}"] = getattr(
+                self, f"get_tools_log_level_{category}"
+            )()
 
-    async def put_tools_log_level_jobs(
-        self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set log level for `jobs`
+        results = await asyncio.gather(*requests.values())
+
+        return dict(zip(requests, results))
+
+    async def put_tools_log_levels(self, **levels: str) -> None:
+        """(async) Set several log levels at once
 
-        Set the log level of the log category `jobs`
-        Tags: Logs
+        The log levels of the categories are set concurrently, so this costs about
+        one round-trip instead of one per category. The main log level, when given,
+        is set first, since it may reset the levels of the categories.
 
         Parameters
         ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
+        **levels
+            Log level (`default`, `verbose` or `trace`) by category. The keys are
+            "main" (for the main log level) or the categories: dicom, generic, http,
+            jobs, lua, plugins, sqlite.
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        Examples
+        --------
+        ```python
+        await client.put_tools_log_levels(main="verbose", http="trace", sqlite="default")
+        ```
         """
-        return await self._put(
-            route=f"{self.url}/tools/log-level-jobs",
-            data=data,
+        unknown = set(levels) - {"main", *_LOG_CATEGORIES}
+        if unknown:
+            raise ValueError(f"Unknown log categories: {', '.join(sorted(unknown))}")
+
+        if "main" in levels:
+            await self.put_tools_log_level(levels.pop("main"))
+
+        await asyncio.gather(
+            *[
+                getattr(self, f"put_tools_log_level_{category}")(level)
+                for category, level in levels.items()
+            ]
         )
 
-    async def get_tools_log_level_lua(
+    async def get_studies_id_attachments_name_bundle(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get log level for `lua`
+        id_: str,
+        name: str,
+        headers: HeaderTypes = None,
+    ) -> Dict[str, Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Get info, MD5, size and compression status of an attachment
+
+        The four requests are sent concurrently, so this costs one round-trip
+        instead of four.
 
-        Get the log level of the log category `lua`
-        Tags: Logs
+        Parameters
+        ----------
+        id_
+            Orthanc identifier of the study of interest
+        name
+            The name of the attachment, or its index (cf. `UserContentType` configuration option)
+        headers
+            Dictionary of optional headers:
+                "If-None-Match" (str): Optional revision of the attachment, to check if its content has changed
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
+        Dict[str, Union[Dict, List, str, bytes, int, httpx.Response]]
+            Dictionary with the "info", "md5", "size" and "is_compressed" keys
         """
-        return await self._get(
-            route=f"{self.url}/tools/log-level-lua",
+        info, md5, size, is_compressed = await asyncio.gather(
+            self.get_studies_id_attachments_name_info(id_, name, headers),
+            self.get_studies_id_attachments_name_md5(id_, name, headers),
+            self.get_studies_id_attachments_name_size(id_, name, headers),
+            self.get_studies_id_attachments_name_is_compressed(id_, name, headers),
         )
 
-    async def put_tools_log_level_lua(
+        return {"info": info, "md5": md5, "size": size, "is_compressed": is_compressed}
+
+    def get_studies_id_media_stream(
         self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set log level for `lua`
+        id_: str,
+        params: QueryParamTypes = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create DICOMDIR media, streamed by chunks
 
-        Set the log level of the log category `lua`
-        Tags: Logs
+        Streaming version of `get_studies_id_media()`. The ZIP file is yielded by chunks
+        as it is received, so it can be written to disk without holding it in memory.
 
         Parameters
         ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
+        id_
+            Orthanc identifier of the study of interest
+        params
+            Same optional parameters as `get_studies_id_media()`
+        chunk_size
+            Size of the yielded chunks, in bytes
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the archive
+
+        Examples
+        --------
+        ```python
+        with open("study.zip", "wb") as file:
+            async for chunk in client.get_studies_id_media_stream(study_id):
+                file.write(chunk)
+        ```
         """
-        return await self._put(
-            route=f"{self.url}/tools/log-level-lua",
-            data=data,
-        )
+        return self._stream("GET", f"/studies/{id_}/media", chunk_size, params=params)
 
-    async def get_tools_log_level_plugins(
+    def post_studies_id_media_stream(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get log level for `plugins`
+        id_: str,
+        json: Any = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create DICOMDIR media synchronously, streamed by chunks
 
-        Get the log level of the log category `plugins`
-        Tags: Logs
+        Streaming version of `post_studies_id_media()` in synchronous mode.
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
+        Parameters
+        ----------
+        id_
+            Orthanc identifier of the study of interest
+        json
+            Same keys as `post_studies_id_media()`, except "Asynchronous"
+        chunk_size
+            Size of the yielded chunks, in bytes
+
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the archive
         """
-        return await self._get(
-            route=f"{self.url}/tools/log-level-plugins",
-        )
+        return self._stream("POST", f"/studies/{id_}/media", chunk_size, json=json)
 
-    async def put_tools_log_level_plugins(
-        self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set log level for `plugins`
+    async def has_study_label(self, id_: str, label: str) -> bool:
+        """(async) Test whether a study has a label
 
-        Set the log level of the log category `plugins`
-        Tags: Logs
+        When `cache_ttl` is set, the answer is cached (30 seconds if the label is
+        present, 5 seconds if it is absent, and never longer than `cache_ttl`), so
+        filtering many studies by the same labels does not cost one round-trip per
+        check. Labels added or removed through this client invalidate the cached answer.
 
         Parameters
         ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
+        id_
+            Orthanc identifier of the study of interest
+        label
+            The label of interest
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        bool
+            True if the study has the label
+
+        Raises
+        ------
+        httpx.HTTPError
+            If the study does not exist.
         """
-        return await self._put(
-            route=f"{self.url}/tools/log-level-plugins",
-            data=data,
-        )
+        key = ("study-label", id_, label)
+        if self.cache_ttl > 0:
+            found, present = self._cache_get(key)
+            if found:
+                return present
+
+        # The labels of the study, rather than `/studies/{id_}/labels/{label}`, which
+        # answers 404 both for an absent label and for an unknown study
+        response = await self._request_with_retries("GET", f"/studies/{id_}/labels")
+        if not 200 <= response.status_code < 300:
+            raise httpx.HTTPError(
+                f"HTTP code: {response.status_code}, with content: {response.text}"
+            )
+        present = label in _json_loads(response.content)
+
+        if self.cache_ttl > 0:
+            ttl = _LABEL_PRESENT_TTL if present else _LABEL_ABSENT_TTL
+            self._cache_set(key, present, min(ttl, self.cache_ttl))
 
-    async def get_tools_log_level_sqlite(
+        return present
+
+    def get_tools_create_archive_stream(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get log level for `sqlite`
+        params: QueryParamTypes = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create ZIP archive, streamed by chunks
 
-        Get the log level of the log category `sqlite`
-        Tags: Logs
+        Streaming version of `get_tools_create_archive()`. The ZIP archive is yielded by chunks
+        as it is received, so it can be written to disk without holding it in memory.
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            Possible values: `default`, `verbose` or `trace`
+        Parameters
+        ----------
+        params
+            Same optional parameters as `get_tools_create_archive()`
+        chunk_size
+            Size of the yielded chunks, in bytes
+
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the archive
         """
-        return await self._get(
-            route=f"{self.url}/tools/log-level-sqlite",
-        )
+        return self._stream("GET", "/tools/create-archive", chunk_size, params=params)
 
-    async def put_tools_log_level_sqlite(
+    def post_tools_create_archive_stream(
         self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set log level for `sqlite`
+        json: Any = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create ZIP archive synchronously, streamed by chunks
 
-        Set the log level of the log category `sqlite`
-        Tags: Logs
+        Streaming version of `post_tools_create_archive()` in synchronous mode.
 
         Parameters
         ----------
-        data
-            Possible values: `default`, `verbose` or `trace`
+        json
+            Same keys as `post_tools_create_archive()`, except "Asynchronous"
+        chunk_size
+            Size of the yielded chunks, in bytes
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the archive
         """
-        return await self._put(
-            route=f"{self.url}/tools/log-level-sqlite",
-            data=data,
-        )
+        return self._stream("POST", "/tools/create-archive", chunk_size, json=json)
 
-    async def post_tools_lookup(
+    def get_tools_create_media_stream(
         self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Look for DICOM identifiers
+        params: QueryParamTypes = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create DICOMDIR media, streamed by chunks
 
-        This URI can be used to convert one DICOM identifier to a list of matching Orthanc resources
-        Tags: System
+        Streaming version of `get_tools_create_media()`. The ZIP file is yielded by chunks
+        as it is received, so it can be written to disk without holding it in memory.
 
         Parameters
         ----------
-        data
-            The DICOM identifier of interest (i.e. the value of `PatientID`, `StudyInstanceUID`, `SeriesInstanceUID`, or `SOPInstanceUID`)
+        params
+            Same optional parameters as `get_tools_create_media()`
+        chunk_size
+            Size of the yielded chunks, in bytes
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            JSON array containing a list of matching Orthanc resources, each item in the list corresponding to a JSON object with the fields `Type`, `ID` and `Path` identifying one DICOM resource that is stored by Orthanc
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the DICOMDIR media
         """
-        return await self._post(
-            route=f"{self.url}/tools/lookup",
-            data=data,
-        )
+        return self._stream("GET", "/tools/create-media", chunk_size, params=params)
 
-    async def get_tools_metrics(
+    def post_tools_create_media_stream(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Are metrics collected?
+        json: Any = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create DICOMDIR media synchronously, streamed by chunks
 
-        Returns a Boolean specifying whether Prometheus metrics are collected and exposed at `/tools/metrics-prometheus`
-        Tags: System
+        Streaming version of `post_tools_create_media()` in synchronous mode.
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            `1` if metrics are collected, `0` if metrics are disabled
+        Parameters
+        ----------
+        json
+            Same keys as `post_tools_create_media()`, except "Asynchronous"
+        chunk_size
+            Size of the yielded chunks, in bytes
+
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the DICOMDIR media
         """
-        return await self._get(
-            route=f"{self.url}/tools/metrics",
-        )
+        return self._stream("POST", "/tools/create-media", chunk_size, json=json)
 
-    async def put_tools_metrics(
+    def get_tools_create_media_extended_stream(
         self,
-        data: RequestData = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Enable collection of metrics
+        params: QueryParamTypes = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create extended DICOMDIR media, streamed by chunks
 
-        Enable or disable the collection and publication of metrics at `/tools/metrics-prometheus`
-        Tags: System
+        Streaming version of `get_tools_create_media_extended()`. The ZIP file is yielded by chunks
+        as it is received, so it can be written to disk without holding it in memory.
 
         Parameters
         ----------
-        data
-            `1` if metrics are collected, `0` if metrics are disabled
+        params
+            Same optional parameters as `get_tools_create_media_extended()`
+        chunk_size
+            Size of the yielded chunks, in bytes
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the DICOMDIR media
         """
-        return await self._put(
-            route=f"{self.url}/tools/metrics",
-            data=data,
+        return self._stream(
+            "GET", "/tools/create-media-extended", chunk_size, params=params
         )
 
-    async def get_tools_metrics_prometheus(
+    def post_tools_create_media_extended_stream(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get usage metrics
+        json: Any = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """(async) Create extended DICOMDIR media synchronously, streamed by chunks
 
-        Get usage metrics of Orthanc in the Prometheus file format (OpenMetrics): https://orthanc.uclouvain.be/book/users/advanced-rest.html#instrumentation-with-prometheus
-        Tags: System
+        Streaming version of `post_tools_create_media_extended()` in synchronous mode.
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            No description
+        Parameters
+        ----------
+        json
+            Same keys as `post_tools_create_media_extended()`, except "Asynchronous"
+        chunk_size
+            Size of the yielded chunks, in bytes
+
+        Yields
+        ------
+        bytes
+            Chunks of the ZIP file containing the DICOMDIR media
         """
-        return await self._get(
-            route=f"{self.url}/tools/metrics-prometheus",
+        return self._stream(
+            "POST", "/tools/create-media-extended", chunk_size, json=json
         )
 
-    async def get_tools_now(
-        self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get UTC time
+    async def get_tools_metrics_prometheus_lines(self) -> AsyncIterator[str]:
+        """(async) Get usage metrics, streamed line by line
 
-        Get UTC time
-        Tags: System
+        Streaming version of `get_tools_metrics_prometheus()`. The metrics are yielded
+        line by line as they are received, so they can be parsed without holding
+        the whole exposition in memory.
 
-        Returns
-        -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The UTC time
+        Yields
+        ------
+        str
+            Lines of the metrics, in the Prometheus text format
+
+        Examples
+        --------
+        ```python
+        async for line in client.get_tools_metrics_prometheus_lines():
+            if line and not line.startswith("#"):
+                name, value = line.rsplit(" ", 1)
+        ```
         """
-        return await self._get(
-            route=f"{self.url}/tools/now",
-        )
+        async for line in self._stream_lines("GET", "/tools/metrics-prometheus"):
+            yield line
 
-    async def get_tools_now_local(
+    async def download_media_extended(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Get local time
+        filepath: Union[str, BinaryIO],
+        json: Any = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> int:
+        """(async) Create extended DICOMDIR media and write it to a file
 
-        Get local time
-        Tags: System
+        The ZIP file is written by chunks as it is received (see
+        `post_tools_create_media_extended_stream()`), so large media never sit in memory.
+
+        Parameters
+        ----------
+        filepath
+            Path of the ZIP file to write, or a binary file object
+        json
+            Same keys as `post_tools_create_media_extended()`, except "Asynchronous"
+        chunk_size
+            Size of the chunks, in bytes
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            The local time
+        int
+            Number of bytes written
         """
-        return await self._get(
-            route=f"{self.url}/tools/now-local",
-        )
+        if isinstance(filepath, str):
+            with open(filepath, "wb") as file:
+                return await self.download_media_extended(file, json, chunk_size)
 
-    async def post_tools_reconstruct(
-        self,
-        json: Any = None,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Reconstruct all the index
+        size = 0
+        async for chunk in self.post_tools_create_media_extended_stream(
+            json, chunk_size
+        ):
+            filepath.write(chunk)
+            size += len(chunk)
+
+        return size
 
-        Reconstruct the index of all the tags of all the DICOM instances that are stored in Orthanc. This is notably useful after the deletion of resources whose children resources have inconsistent values with their sibling resources. Beware that this is a highly time-consuming operation, as all the DICOM instances will be parsed again, and as all the Orthanc index will be regenerated. If you have a large database to process, it is advised to use the Housekeeper plugin to perform this action resource by resource
-        Tags: System
+    async def list_media_extended_contents(
+        self, json: Any = None, timeout: Optional[float] = None
+    ) -> List[zipfile.ZipInfo]:
+        """(async) List the files of extended DICOMDIR media, without downloading it
+
+        The media is created by an asynchronous job, and only the end of the ZIP file
+        (its central directory, i.e. about 100 bytes per file) is then fetched with
+        HTTP range requests, instead of the whole archive. The media is then deleted
+        from Orthanc (or its job cancelled if it did not complete).
 
         Parameters
         ----------
         json
-            Dictionary with the following keys:
-              "ReconstructFiles": Also reconstruct the files of the resources (e.g: apply IngestTranscoding, StorageCompression). 'false' by default. (New in Orthanc 1.11.0)
+            Same keys as `post_tools_create_media_extended()`, except "Asynchronous"
+            and "Synchronous"
+        timeout
+            Maximum number of seconds to wait for the job creating the media
+            (no limit by default).
+
+        Returns
+        -------
+        List[zipfile.ZipInfo]
+            Files of the media (name, size, compressed size, date, etc.)
+
+        Raises
+        ------
+        errors.JobFailedError
+            If the job creating the media fails.
+        asyncio.TimeoutError
+            If the job does not complete within `timeout` seconds.
+        """
+        client = self
+        if self.return_raw_response:
+            client = copy.copy(self)
+            client.return_raw_response = False
+
+        job = await client.post_tools_create_media_extended(
+            {**(json or {}), "Asynchronous": True}
+        )
+        completed = False
+        try:
+            await client._wait_for_job(job["ID"], timeout)
+            completed = True
+
+            return await client._list_zip_contents(f"/jobs/{job['ID']}/archive")
+        finally:
+            await client._discard_job(job["ID"], completed)
+
+    async def _list_zip_contents(self, route: str) -> List[zipfile.ZipInfo]:
+        """List the files of a ZIP resource from its central directory"""
+        tail, tail_start = await self._get_range(route, -_ZIP_TAIL_SIZE)
+        end_position = tail.rfind(b"PK\x05\x06")
+        if end_position < 0:
+            raise zipfile.BadZipFile("End of central directory not found")
+        end = _ZIP_END_STRUCT.unpack_from(tail, end_position)
+        size_cd, offset_cd = end[5], end[6]
+        records_position = end_position
+
+        locator_position = end_position - _ZIP64_LOCATOR_STRUCT.size
+        if (
+            locator_position >= 0
+            and tail[locator_position : locator_position + 4] == b"PK\x06\x07"
+        ):
+            locator = _ZIP64_LOCATOR_STRUCT.unpack_from(tail, locator_position)
+            records_position = locator[2] - tail_start
+            end64 = _ZIP64_END_STRUCT.unpack_from(tail, records_position)
+            size_cd, offset_cd = end64[8], end64[9]
+
+        if offset_cd >= tail_start:
+            data, data_start = tail, tail_start
+        else:
+            data, data_start = await self._get_range(
+                route, offset_cd, offset_cd + size_cd - 1
+            )
+        central_directory = data[offset_cd - data_start :][:size_cd]
+
+        # The central directory followed by the end records is a valid ZIP file for
+        # `zipfile`, which accounts for the missing content before it
+        content = BytesIO(central_directory + tail[records_position:])
+        with zipfile.ZipFile(content) as archive:
+            return archive.infolist()
+
+    async def _wait_for_job(self, id_: str, timeout: Optional[float] = None) -> None:
+        """Wait for a job to succeed
+
+        Raises `errors.JobFailedError` if it fails, and `asyncio.TimeoutError` if it
+        does not complete within `timeout` seconds (e.g. a paused job).
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = 0.05
+        while True:
+            job = await self.get_jobs_id(id_)
+            if job["State"] == "Success":
+                return
+            if job["State"] == "Failure":
+                raise errors.JobFailedError(
+                    f"Job {id_} failed: {job.get('ErrorDescription')}", job
+                )
+
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(
+                        f"Job {id_} did not complete within {timeout} seconds "
+                        f"(state: {job['State']})"
+                    )
+                interval = min(interval, remaining)
+
+            await asyncio.sleep(interval)
+            interval = min(2 * interval, _MAX_JOB_POLL_INTERVAL)
+
+    async def _discard_job(self, id_: str, completed: bool) -> None:
+        """Delete the output of a completed job, or cancel an unfinished one"""
+        try:
+            if completed:
+                await self.delete_jobs_id_key(id_, "archive")
+            else:
+                await self.post_jobs_id_cancel(id_)
+        except httpx.HTTPError as error:
+            # E.g. a failed job cannot be cancelled; the original error matters more
+            logger.debug("Could not discard job %s: %s", id_, error)
 
+    async def _get_range(
+        self, route: str, start: int, end: Optional[int] = None
+    ) -> Tuple[bytes, int]:
+        """GET a range of bytes (the last `-start` bytes if `start` is negative)
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        Tuple[bytes, int]
+            Bytes, and their offset in the resource. Servers that ignore the range
+            answer with the whole resource, at offset 0.
         """
-        if json is None:
-            json = {}
-        return await self._post(
-            route=f"{self.url}/tools/reconstruct",
-            json=json,
+        if start < 0:
+            range_ = f"bytes={start}"
+        else:
+            range_ = f"bytes={start}-{'' if end is None else end}"
+
+        response = await self._request_with_retries(
+            "GET", route, headers={"Range": range_}
         )
+        if response.status_code == 206:
+            # Content-Range: bytes <first>-<last>/<size>
+            first = int(response.headers["content-range"].split()[1].split("-")[0])
+            return response.content, first
+        if response.status_code == 200:
+            return response.content, 0
 
-    async def post_tools_reset(
+        raise httpx.HTTPError(
+            f"HTTP code: {response.status_code}, with content: {response.text}"
+        )
+
+    async def post_studies_id_attachments_verify_md5_batch(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Restart Orthanc
+        id_: str,
+        names: Iterable[str],
+    ) -> List[Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Verify several attachments of a study
 
-        Restart Orthanc
-        Tags: System
+        The attachments are verified concurrently. With `http2=True` behind an
+        HTTP/2 reverse proxy, the requests are multiplexed over a single connection.
+
+        Parameters
+        ----------
+        id_
+            Orthanc identifier of the study of interest
+        names
+            The names of the attachments, or their indexes (cf. `UserContentType` configuration option)
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        List[Union[Dict, List, str, bytes, int, httpx.Response]]
+            Results of `post_studies_id_attachments_name_verify_md5()`, in the order of `names`.
         """
-        return await self._post(
-            route=f"{self.url}/tools/reset",
+        return await self._gather_bounded(
+            self.post_studies_id_attachments_name_verify_md5(id_, name)
+            for name in names
         )
 
-    async def post_tools_shutdown(
+    async def put_studies_id_labels_batch(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Shutdown Orthanc
+        id_: str,
+        labels: Iterable[str],
+    ) -> List[Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Add several labels to a study
 
-        Shutdown Orthanc
-        Tags: System
+        The labels are added concurrently, so this costs about one round-trip
+        instead of one per label.
+
+        Parameters
+        ----------
+        id_
+            Orthanc identifier of the study of interest
+        labels
+            The labels to be added
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
+        List[Union[Dict, List, str, bytes, int, httpx.Response]]
+            Results of `put_studies_id_labels_label()`, in the order of `labels`.
         """
-        return await self._post(
-            route=f"{self.url}/tools/shutdown",
+        return await self._gather_bounded(
+            self.put_studies_id_labels_label(id_, label) for label in labels
         )
 
-    async def get_tools_unknown_sop_class_accepted(
+    async def delete_studies_id_labels_batch(
         self,
-    ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Is unknown SOP class accepted?
+        id_: str,
+        labels: Iterable[str],
+    ) -> List[Union[Dict, List, str, bytes, int, httpx.Response]]:
+        """(async) Remove several labels from a study
 
-        Shall Orthanc C-STORE SCP accept DICOM instances with an unknown SOP class UID?
-        Tags: System
+        The labels are removed concurrently, so this costs about one round-trip
+        instead of one per label.
+
+        Parameters
+        ----------
+        id_
+            Orthanc identifier of the study of interest
+        labels
+            The labels to be removed
 
         Returns
         -------
-        Union[Dict, List, str, bytes, int, httpx.Response]
-            `1` if accepted, `0` if not accepted
+        List[Union[Dict, List, str, bytes, int, httpx.Response]]
+            Results of `delete_studies_id_labels_label()`, in the order of `labels`.
         """
-        return await self._get(
-            route=f"{self.url}/tools/unknown-sop-class-accepted",
+        return await self._gather_bounded(
+            self.delete_studies_id_labels_label(id_, label) for label in labels
         )
 
-    async def put_tools_unknown_sop_class_accepted(
+    async def get_studies_id_series(
         self,
-        data: RequestData = None,
+        id_: str,
+        params: QueryParamTypes = None,
+        requested_tags: Optional[Iterable[str]] = None,
     ) -> Union[Dict, List, str, bytes, int, httpx.Response]:
-        """(async) Set unknown SOP class accepted
+        """(async) Get child series
 
-        Set whether Orthanc C-STORE SCP should accept DICOM instances with an unknown SOP class UID
-        Tags: System
+        Get detailed information about the child series of the DICOM study whose Orthanc identifier is provided in the URL
+        Tags: Studies
 
         Parameters
         ----------
-        data
-            `1` if accepted, `0` if not accepted
+        id_
+            Orthanc identifier of the study of interest
+        params
+            Dictionary of optional parameters:
+                "expand" (str): If false or missing, only retrieve the list of child series
+                "full" (bool): If present, report the DICOM tags in full format (tags indexed by their hexadecimal format, associated with their symbolic name and their value)
+                "requested-tags" (str): If present, list the DICOM Tags you want to list in the response.  This argument is a semi-column separated list of DICOM Tags identifiers; e.g: 'requested-tags=0010,0010;PatientBirthDate'.  The tags requested tags are returned in the 'RequestedTags' field in the response.  Note that, if you are requesting tags that are not listed in the Main Dicom Tags stored in DB, building the response might be slow since Orthanc will need to access the DICOM files.  If not specified, Orthanc will return
+                "short" (bool): If present, report the DICOM tags in hexadecimal format
+        requested_tags
+            DICOM tags to report in the 'RequestedTags' field of each series (e.g.
+            `["0008,103E", "BodyPartExamined"]`), instead of writing the "requested-tags"
+            parameter by hand. Implies "expand". This saves a request per series for
+            the tags that are not among the main DICOM tags.
 
         Returns
         -------
         Union[Dict, List, str, bytes, int, httpx.Response]
+            JSON array containing information about the child DICOM series
         """
-        return await self._put(
-            route=f"{self.url}/tools/unknown-sop-class-accepted",
-            data=data,
-        )
+        if requested_tags is not None:
+            params = dict(params or {})
+            params.update({"expand": True, "requested-tags": ";".join(requested_tags)})
+
+        return await super().get_studies_id_series(id_, params)
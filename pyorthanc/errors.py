@@ -4,3 +4,11 @@ class TagDoesNotExistError(Exception):
 
 class ModificationError(Exception):
     pass
+
+
+class JobFailedError(Exception):
+    """An Orthanc job ended in the "Failure" state"""
+
+    def __init__(self, message: str, job: dict):
+        super().__init__(message)
+        self.job = job  # Information about the job (GET /jobs/{id})
@@ -1,15 +1,23 @@
+import re
+
 import simple_openapi_client
 
 ORTHANC_API_URL = 'https://orthanc.uclouvain.be/api/orthanc-openapi.json'
 
 
 def generate_client(path: str, async_mode: bool = False):
-    config = simple_openapi_client.Config(client_name='AsyncOrthanc' if async_mode else 'Orthanc')
+    # The async methods are generated in a base class; `AsyncOrthanc` (pyorthanc/async_client.py)
+    # extends it with the hand-written request handling (retries, caches, streaming, etc.)
+    config = simple_openapi_client.Config(client_name='_AsyncOrthanc' if async_mode else 'Orthanc')
 
     document = simple_openapi_client.parse_openapi(ORTHANC_API_URL)
     document = _apply_corrections_to_documents(document)
     client_str = simple_openapi_client.make_client(document, config, async_mode=async_mode, use_black=True)
 
+    if async_mode:
+        client_str = _make_routes_relative(client_str)
+        client_str = _share_empty_json_payload(client_str)
+
     with open(path, 'w') as file:
         file.write(client_str)
 
@@ -39,6 +47,41 @@ def _apply_corrections_to_documents(document):
     return document
 
 
+def _make_routes_relative(client_str: str) -> str:
+    """Pass routes relative to the server's URL, e.g. `f"{self.url}/studies/{id_}"` -> `f"/studies/{id_}"`
+
+    `AsyncOrthanc` resolves them against its httpx base URL. Routes without
+    placeholders become plain string literals.
+    """
+    def replace(match: re.Match) -> str:
+        route = match.group(1)
+
+        return f'f"{route}"' if '{' in route else f'"{route}"'
+
+    return re.sub(r'f"\{self\.url\}(/[^"]*)"', replace, client_str)
+
+
+
+def _share_empty_json_payload(client_str: str) -> str:
+    """Default the JSON payloads to a shared read-only mapping, instead of a new dict per call
+
+    `if json is None: json = {}` followed by `json=json` becomes `json=_EMPTY_JSON if json is None else json`.
+    `AsyncOrthanc` sends the empty mapping as a pre-encoded `{}` body.
+    """
+    client_str = re.sub(
+        r'        if json is None:\n            json = \{\}\n'
+        r'(        return await self\._(?:post|put)\(\n(?:            (?!json=).*\n)*)'
+        r'            json=json,\n',
+        r'\1            json=_EMPTY_JSON if json is None else json,\n',
+        client_str,
+    )
+
+    client_str = client_str.replace('from typing import', 'from types import MappingProxyType\nfrom typing import', 1)
+    definition = '# Default JSON payload of the POST/PUT methods (shared, hence read-only)\n_EMPTY_JSON = MappingProxyType({})\n'
+
+    return client_str.replace('\n\nclass _AsyncOrthanc(', f'\n{definition}\n\nclass _AsyncOrthanc(', 1)
+
+
 if __name__ == '__main__':
     generate_client('./pyorthanc/client.py', async_mode=False)
-    generate_client('./pyorthanc/async_client.py', async_mode=True)
+    generate_client('./pyorthanc/_async_client.py', async_mode=True)
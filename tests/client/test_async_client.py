@@ -0,0 +1,787 @@
+import asyncio
+import gzip
+import io
+import json
+import zipfile
+
+import httpx
+import pytest
+
+from pyorthanc import AsyncOrthanc, errors
+from ..data import a_patient, a_series, a_study
+
+
+def make_mock_client(handler, **kwargs) -> AsyncOrthanc:
+    """Client answered by `handler(request)` instead of an Orthanc server"""
+    return AsyncOrthanc('http://orthanc', transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_map_series(async_client_with_data: AsyncOrthanc):
+    result = asyncio.run(async_client_with_data.map_series(
+        [a_series.IDENTIFIER],
+        lambda client, id_: client.get_series_id_patient(id_),
+    ))
+
+    assert [patient['ID'] for patient in result] == [a_patient.IDENTIFIER]
+
+
+def test_get_studies_id_attachments_name_bundle(async_client_with_data: AsyncOrthanc):
+    async def run():
+        await async_client_with_data.put_studies_id_attachments_name(a_study.IDENTIFIER, '1024', b'attachment')
+
+        return await async_client_with_data.get_studies_id_attachments_name_bundle(a_study.IDENTIFIER, '1024')
+
+    result = asyncio.run(run())
+
+    assert set(result) == {'info', 'md5', 'size', 'is_compressed'}
+    assert result['size'] == len(b'attachment')
+    assert result['info']['Uuid']
+
+
+def test_get_studies_id_media_stream(async_client_with_data: AsyncOrthanc):
+    async def run():
+        return b''.join([chunk async for chunk in async_client_with_data.get_studies_id_media_stream(a_study.IDENTIFIER)])
+
+    result = asyncio.run(run())
+
+    assert result.startswith(b'PK')  # ZIP file signature
+
+
+def test_studies_labels_batch(async_client_with_data: AsyncOrthanc):
+    labels = ['my_label', 'my_other_label']
+
+    async def run():
+        await async_client_with_data.put_studies_id_labels_batch(a_study.IDENTIFIER, labels)
+        added = await async_client_with_data.get_studies_id_labels(a_study.IDENTIFIER)
+
+        await async_client_with_data.delete_studies_id_labels_batch(a_study.IDENTIFIER, labels)
+        removed = await async_client_with_data.get_studies_id_labels(a_study.IDENTIFIER)
+
+        return added, removed
+
+    added, removed = asyncio.run(run())
+
+    assert sorted(added) == labels
+    assert removed == []
+
+
+def test_has_study_label(async_client_with_data: AsyncOrthanc):
+    async def run():
+        before = await async_client_with_data.has_study_label(a_study.IDENTIFIER, 'my_label')
+        await async_client_with_data.put_studies_id_labels_label(a_study.IDENTIFIER, 'my_label')
+        after_put = await async_client_with_data.has_study_label(a_study.IDENTIFIER, 'my_label')
+        await async_client_with_data.delete_studies_id_labels_label(a_study.IDENTIFIER, 'my_label')
+        after_delete = await async_client_with_data.has_study_label(a_study.IDENTIFIER, 'my_label')
+
+        return before, after_put, after_delete
+
+    assert asyncio.run(run()) == (False, True, False)
+
+
+def test_has_study_label_unknown_study():
+    client = make_mock_client(lambda request: httpx.Response(404, json={'OrthancError': 'Unknown resource'}))
+
+    with pytest.raises(httpx.HTTPError):
+        asyncio.run(client.has_study_label('unknown', 'my_label'))
+
+
+def test_has_study_label_without_cache():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=['my_label'])
+
+    client = make_mock_client(handler, cache_ttl=0)
+
+    async def run():
+        return [await client.has_study_label('a-study', 'my_label') for _ in range(2)]
+
+    assert asyncio.run(run()) == [True, True]
+    assert [r.url.path for r in requests] == ['/studies/a-study/labels'] * 2
+
+
+def test_post_studies_id_attachments_verify_md5_batch(async_client_with_data: AsyncOrthanc):
+    async def run():
+        await async_client_with_data.put_studies_id_attachments_name(a_study.IDENTIFIER, '1024', b'attachment')
+
+        return await async_client_with_data.post_studies_id_attachments_verify_md5_batch(a_study.IDENTIFIER, ['1024'])
+
+    assert asyncio.run(run()) == [{}]
+
+
+def test_get_many_studies_statistics(async_client_with_data: AsyncOrthanc):
+    result = asyncio.run(async_client_with_data.get_many_studies_statistics([a_study.IDENTIFIER]))
+
+    assert len(result) == 1
+    assert result[0]['CountSeries'] == len(a_study.SERIES)
+
+
+def test_await_many(async_client_with_data: AsyncOrthanc):
+    result = asyncio.run(async_client_with_data.await_many(
+        [async_client_with_data.get_studies_id(a_study.IDENTIFIER), async_client_with_data.get_series()],
+        limit=1,
+    ))
+
+    assert result[0]['ID'] == a_study.IDENTIFIER
+    assert a_series.IDENTIFIER in result[1]
+
+
+def test_post_tools_create_archive_stream(async_client_with_data: AsyncOrthanc):
+    async def run():
+        stream = async_client_with_data.post_tools_create_archive_stream({'Resources': [a_study.IDENTIFIER]})
+
+        return b''.join([chunk async for chunk in stream])
+
+    result = asyncio.run(run())
+
+    assert result.startswith(b'PK')  # ZIP file signature
+
+
+def test_get_tools_metrics_prometheus_lines(async_client: AsyncOrthanc):
+    async def run():
+        lines = [line async for line in async_client.get_tools_metrics_prometheus_lines()]
+        body = await async_client.get_tools_metrics_prometheus()
+
+        return lines, body
+
+    lines, body = asyncio.run(run())
+
+    assert lines == body.splitlines()
+
+
+def test_get_tools_accepted_transfer_syntaxes_cache(async_client: AsyncOrthanc):
+    async def run():
+        before = await async_client.get_tools_accepted_transfer_syntaxes()
+        await async_client.put_tools_accepted_transfer_syntaxes(json=['1.2.840.10008.1.2'])
+        after = await async_client.get_tools_accepted_transfer_syntaxes()
+        await async_client.put_tools_accepted_transfer_syntaxes(json=before)
+
+        return after
+
+    assert asyncio.run(run()) == ['1.2.840.10008.1.2']
+
+
+def test_get_studies_id_batched(async_client_with_data: AsyncOrthanc):
+    async def run():
+        return await asyncio.gather(
+            async_client_with_data.get_studies_id_batched(a_study.IDENTIFIER),
+            async_client_with_data.get_studies_id_batched(a_study.IDENTIFIER),
+        )
+
+    result = asyncio.run(run())
+
+    assert [study['ID'] for study in result] == [a_study.IDENTIFIER, a_study.IDENTIFIER]
+    assert result[0]['MainDicomTags']['StudyInstanceUID'] == a_study.UID
+
+
+def test_post_tools_bulk_delete_parallel(async_client_with_data: AsyncOrthanc):
+    async def run():
+        instances = await async_client_with_data.get_instances()
+        await async_client_with_data.post_tools_bulk_delete_parallel(instances, chunks=2)
+
+        return await async_client_with_data.get_instances()
+
+    assert asyncio.run(run()) == []
+
+
+def test_get_studies_id_series_with_requested_tags(async_client_with_data: AsyncOrthanc):
+    result = asyncio.run(async_client_with_data.get_studies_id_series(a_study.IDENTIFIER, requested_tags=['0008,103E']))
+
+    assert sorted(series['ID'] for series in result) == sorted(a_study.SERIES)
+    assert all('RequestedTags' in series for series in result)
+
+
+def test_post_tools_find_many(async_client_with_data: AsyncOrthanc):
+    result = asyncio.run(async_client_with_data.post_tools_find_many('StudyInstanceUID', [a_study.UID, '1.2.3']))
+
+    assert [study['ID'] for study in result[a_study.UID]] == [a_study.IDENTIFIER]
+    assert result['1.2.3'] == []
+
+
+def test_get_tools_snapshot(async_client: AsyncOrthanc):
+    async def run():
+        snapshot = await async_client.get_tools_snapshot()
+        log_level_http = await async_client.get_tools_log_level_http()
+
+        return snapshot, log_level_http
+
+    result, log_level_http = asyncio.run(run())
+
+    assert result['log_level_http'] == log_level_http
+    assert {'now', 'default_encoding', 'labels', 'metrics', 'log_level'} <= set(result)
+
+
+def test_download_media_extended(async_client_with_data: AsyncOrthanc, tmp_path):
+    filepath = str(tmp_path / 'media.zip')
+
+    size = asyncio.run(async_client_with_data.download_media_extended(filepath, {'Resources': [a_study.IDENTIFIER]}))
+
+    with open(filepath, 'rb') as file:
+        content = file.read()
+    assert len(content) == size
+    assert content.startswith(b'PK')  # ZIP file signature
+
+
+def test_list_media_extended_contents(async_client_with_data: AsyncOrthanc):
+    result = asyncio.run(async_client_with_data.list_media_extended_contents({'Resources': [a_study.IDENTIFIER]}))
+
+    assert 'DICOMDIR' in [info.filename for info in result]
+
+
+def test_get_tools_log_level_http_cache(async_client: AsyncOrthanc):
+    async def run():
+        before = await async_client.get_tools_log_level_http()
+        await async_client.put_tools_log_level_http('verbose')
+        after = await async_client.get_tools_log_level_http()
+        await async_client.put_tools_log_level_http(before)
+
+        return after
+
+    assert asyncio.run(run()) == 'verbose'
+
+
+def test_put_tools_log_levels(async_client: AsyncOrthanc):
+    async def run():
+        before = await async_client.get_tools_snapshot()
+        await async_client.put_tools_log_levels(http='verbose', jobs='trace')
+        after = await async_client.get_tools_snapshot()
+        await async_client.put_tools_log_levels(http=before['log_level_http'], jobs=before['log_level_jobs'])
+
+        return after
+
+    after = asyncio.run(run())
+
+    assert after['log_level_http'] == 'verbose'
+    assert after['log_level_jobs'] == 'trace'
+
+
+def test_put_tools_log_levels_unknown_category(async_client: AsyncOrthanc):
+    with pytest.raises(ValueError):
+        asyncio.run(async_client.put_tools_log_levels(foo='verbose'))
+
+
+def test_post_tools_find_batch(async_client_with_data: AsyncOrthanc):
+    result = asyncio.run(async_client_with_data.post_tools_find_batch([
+        {'Level': 'Study', 'Query': {'StudyInstanceUID': a_study.UID}},
+        {'Level': 'Study', 'Query': {'StudyInstanceUID': '1.2.3'}},
+    ]))
+
+    assert result == [[a_study.IDENTIFIER], []]
+
+
+def test_post_with_empty_data():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    client = make_mock_client(handler)
+
+    asyncio.run(client.post_modalities_id_store('a-modality', data={}))
+    asyncio.run(client.post_modalities_id_store('a-modality', data={'Resources': 'a-study'}))
+
+    assert requests[0].content == b'{}'
+    assert requests[0].headers['Content-Type'] == 'application/json'
+    assert requests[1].content == b'Resources=a-study'
+
+
+def test_get_system_cache():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={'Version': str(len(requests))})
+
+    async def run(client):
+        first = await client.get_system()
+        second = await client.get_system()
+        await client.put_tools_default_encoding('Latin1')  # Does not affect /system
+
+        return first, second, await client.get_system()
+
+    assert asyncio.run(run(make_mock_client(handler))) == ({'Version': '1'}, {'Version': '2'}, {'Version': '4'})
+
+    requests.clear()
+    assert asyncio.run(run(make_mock_client(handler, cache_ttl=60))) == ({'Version': '1'},) * 3
+    assert [r.url.path for r in requests] == ['/system', '/tools/default-encoding']
+
+
+def test_put_tools_log_level_invalidates_cache():
+    levels = {'/tools/log-level-http': 'default'}
+
+    def handler(request):
+        if request.method == 'PUT':
+            levels[request.url.path] = request.content.decode()
+        return httpx.Response(200, text=levels[request.url.path])
+
+    client = make_mock_client(handler, cache_ttl=60)
+
+    async def run():
+        before = await client.get_tools_log_level_http()
+        await client.put_tools_log_level_http('verbose')
+
+        return before, await client.get_tools_log_level_http()
+
+    assert asyncio.run(run()) == ('default', 'verbose')
+
+
+@pytest.mark.parametrize('kwargs, expected_requests, shared', [
+    ({}, 2, False),
+    ({'coalesce_requests': True}, 1, True),
+    ({'coalesce_requests': True, 'return_raw_response': True}, 2, False),
+])
+def test_get_coalescing(kwargs, expected_requests, shared):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)  # Both calls are in flight at the same time
+        return httpx.Response(200, json={'ID': 'a-study'})
+
+    client = make_mock_client(handler, **kwargs)
+
+    async def run():
+        return await asyncio.gather(client.get_studies_id('a-study'), client.get_studies_id('a-study'))
+
+    first, second = asyncio.run(run())
+
+    assert len(requests) == expected_requests
+    assert (first is second) == shared
+
+
+
+def test_get_coalescing_changing_answers():
+    uids = iter(range(10))
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=f'1.2.{next(uids)}', headers={'Content-Type': 'text/plain'})
+
+    client = make_mock_client(handler, coalesce_requests=True)
+
+    async def run():
+        return await asyncio.gather(
+            *(client.get_tools_generate_uid({'level': 'study'}) for _ in range(3)),
+            *(client.get_tools_now() for _ in range(2)),
+        )
+
+    assert len(set(asyncio.run(run()))) == 5
+
+
+def test_get_coalescing_after_put():
+    level = 'default'
+
+    async def handler(request):
+        nonlocal level
+        if request.method == 'PUT':
+            level = request.content.decode()
+            return httpx.Response(200)
+        answer = level
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, text=answer, headers={'Content-Type': 'text/plain'})
+
+    client = make_mock_client(handler, coalesce_requests=True)
+
+    async def run():
+        pending = asyncio.ensure_future(client.get_tools_log_level_http())
+        await asyncio.sleep(0.01)  # The GET is in flight, with the old level
+        await client.put_tools_log_level_http('verbose')
+        return await pending, await client.get_tools_log_level_http()
+
+    assert asyncio.run(run()) == ('default', 'verbose')
+
+def test_get_studies_id_batched_after_cancellation():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        resources = json.loads(request.content)['Resources']
+        return httpx.Response(200, json=[{'ID': id_} for id_ in resources])
+
+    client = make_mock_client(handler)
+
+    async def cancelled_call():
+        asyncio.ensure_future(client.get_studies_id_batched('a-study'))
+        await asyncio.sleep(0)  # Left pending: cancelled when the loop shuts down
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(client.get_studies_id_batched('a-study'), client.get_studies_id_batched('b-study')),
+            timeout=5,
+        )
+
+    asyncio.run(cancelled_call())
+
+    assert asyncio.run(run()) == [{'ID': 'a-study'}, {'ID': 'b-study'}]
+    assert [r.url.path for r in requests] == ['/tools/bulk-content']
+
+
+def test_get_request_template_follows_client_changes():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    client = make_mock_client(handler)
+
+    async def run():
+        await client.get_patients()
+        client.params = {'expand': 'true'}
+        await client.get_patients()
+        client.headers['X-Test'] = 'value'
+        await client.get_patients()
+        client.base_url = 'http://other-orthanc'
+        await client.get_patients()
+
+    asyncio.run(run())
+
+    assert [str(r.url) for r in requests] == [
+        'http://orthanc/patients',
+        'http://orthanc/patients?expand=true',
+        'http://orthanc/patients?expand=true',
+        'http://other-orthanc/patients?expand=true',
+    ]
+    assert 'X-Test' not in requests[1].headers
+    assert requests[2].headers['X-Test'] == 'value'
+
+
+def _make_job_handler(states, requests):
+    """Handler of a media job going through `states` (its archive has one file)"""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zip_file:
+        zip_file.writestr('DICOMDIR', b'content')
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.url.path == '/tools/create-media-extended':
+            return httpx.Response(200, json={'ID': 'job', 'Path': '/jobs/job'})
+        if request.url.path == '/jobs/job':
+            state = states.pop(0) if len(states) > 1 else states[0]
+            return httpx.Response(200, json={'ID': 'job', 'State': state, 'ErrorDescription': 'Error'})
+        if request.url.path == '/jobs/job/archive' and request.method == 'GET':
+            return httpx.Response(200, content=archive.getvalue())
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def test_list_media_extended_contents_deletes_archive():
+    requests = []
+    client = make_mock_client(_make_job_handler(['Running', 'Success'], requests))
+
+    result = asyncio.run(client.list_media_extended_contents({'Resources': ['id']}))
+
+    assert [info.filename for info in result] == ['DICOMDIR']
+    assert requests[-1] == ('DELETE', '/jobs/job/archive')
+
+
+def test_list_media_extended_contents_failed_job():
+    requests = []
+    client = make_mock_client(_make_job_handler(['Failure'], requests))
+
+    with pytest.raises(errors.JobFailedError) as exception_info:
+        asyncio.run(client.list_media_extended_contents())
+
+    assert exception_info.value.job['State'] == 'Failure'
+    assert requests[-1] == ('POST', '/jobs/job/cancel')
+
+
+def test_list_media_extended_contents_timeout():
+    requests = []
+    client = make_mock_client(_make_job_handler(['Paused'], requests))
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(client.list_media_extended_contents(timeout=0.2))
+
+    assert requests[-1] == ('POST', '/jobs/job/cancel')
+
+
+@pytest.mark.parametrize('limit', [0, -1])
+def test_await_many_invalid_limit(limit):
+    client = make_mock_client(lambda request: httpx.Response(200, json=[]))
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.await_many((client.get_patients() for _ in range(2)), limit))
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.post_tools_find_batch([{'Level': 'Study', 'Query': {}}], concurrency=limit))
+
+
+@pytest.mark.parametrize('chunks', [0, -2])
+def test_post_tools_bulk_delete_parallel_invalid_chunks(chunks):
+    client = make_mock_client(lambda request: httpx.Response(200, json={}))
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.post_tools_bulk_delete_parallel(['id1', 'id2'], chunks))
+
+
+def test_invalid_max_retries():
+    with pytest.raises(ValueError):
+        AsyncOrthanc('http://orthanc', max_retries=-1)
+
+
+@pytest.mark.parametrize('pool_size', [0, -1])
+def test_invalid_pool_size(pool_size):
+    with pytest.raises(ValueError):
+        AsyncOrthanc('http://orthanc', pool_size=pool_size)
+
+
+def test_post_stream_payload():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b'archive')
+
+    client = make_mock_client(handler)
+
+    async def run():
+        return [
+            b''.join([chunk async for chunk in client.post_tools_create_archive_stream()]),
+            b''.join([chunk async for chunk in client.post_tools_create_media_stream({'Resources': ['id']})]),
+        ]
+
+    assert asyncio.run(run()) == [b'archive', b'archive']
+    assert json.loads(requests[0].content) == {}
+    assert json.loads(requests[1].content) == {'Resources': ['id']}
+    assert all(r.headers['Content-Type'] == 'application/json' for r in requests)
+
+
+def test_post_tools_find_many_pages():
+    studies = [{'ID': str(i), 'RequestedTags': {'StudyInstanceUID': f'1.2.{i % 3}'}} for i in range(5)]
+    queries = []
+
+    def handler(request):
+        query = json.loads(request.content)
+        queries.append(query)
+        return httpx.Response(200, json=studies[query['Since']:query['Since'] + query['Limit']])
+
+    client = make_mock_client(handler)
+
+    result = asyncio.run(client.post_tools_find_many('0020,000D', ['1.2.0', '1.2.1', '1.2.9'], page_size=2))
+
+    assert [query['Since'] for query in queries] == [0, 2, 4]
+    assert queries[0]['Query'] == {'0020,000D': '1.2.0\\1.2.1\\1.2.9'}
+    assert {value: [s['ID'] for s in found] for value, found in result.items()} == {
+        '1.2.0': ['0', '3'],
+        '1.2.1': ['1', '4'],
+        '1.2.9': [],
+    }
+
+
+def test_post_tools_find_many_raw_response():
+    studies = [{'ID': 'id', 'RequestedTags': {'StudyInstanceUID': '1.2.3'}}]
+    client = make_mock_client(lambda request: httpx.Response(200, json=studies), return_raw_response=True)
+
+    result = asyncio.run(client.post_tools_find_many('StudyInstanceUID', ['1.2.3']))
+
+    assert result == {'1.2.3': studies}
+    assert client.return_raw_response
+
+
+@pytest.mark.parametrize('value', ['1.2.*', '1.2.?', '1.2\\1.3'])
+def test_post_tools_find_many_special_characters(value):
+    client = make_mock_client(lambda request: httpx.Response(200, json=[]))
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.post_tools_find_many('StudyInstanceUID', [value]))
+
+
+@pytest.mark.parametrize('method, route', [('GET', '/patients'), ('PUT', '/tools/log-level')])
+def test_retries_transient_failures(method, route):
+    requests = []
+    answers = [httpx.ConnectError('refused'), httpx.Response(503), httpx.Response(200, json={})]
+
+    def handler(request):
+        requests.append(request)
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    client = make_mock_client(handler)
+
+    if method == 'GET':
+        result = asyncio.run(client._get(route))
+    else:
+        result = asyncio.run(client._put(route, content='verbose'))
+
+    assert result == {}
+    assert len(requests) == 3
+
+
+def test_retries_exhausted():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503, text='Busy')
+
+    client = make_mock_client(handler, max_retries=1)
+
+    with pytest.raises(httpx.HTTPError):
+        asyncio.run(client.get_patients())
+    assert len(requests) == 2
+
+    # POST requests are not idempotent, they are never retried
+    requests.clear()
+    with pytest.raises(httpx.HTTPError):
+        asyncio.run(client.post_tools_find({'Level': 'Study', 'Query': {}}))
+    assert len(requests) == 1
+
+
+def test_get_query_parameters():
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, json=[])
+
+    client = make_mock_client(handler)
+
+    async def run():
+        await client.get_patients(params={'expand': True, 'limit': 10})
+        await client.get_patients(params={'expand': True, 'limit': 10})
+        await client.get_patients(params={'expand': True, 'requested-tags': ['PatientID', 'PatientName']})
+        await client.get_patients()
+
+    asyncio.run(run())
+
+    assert urls == [
+        'http://orthanc/patients?expand=true&limit=10',
+        'http://orthanc/patients?expand=true&limit=10',
+        'http://orthanc/patients?expand=true&requested-tags=PatientID&requested-tags=PatientName',
+        'http://orthanc/patients',
+    ]
+
+
+@pytest.mark.parametrize('compress_requests, resources, compressed', [
+    (True, 1000, True),
+    (True, 1, False),  # Below the threshold
+    (False, 1000, False),
+])
+def test_post_bulk_compression(compress_requests, resources, compressed):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    client = make_mock_client(handler, compress_requests=compress_requests)
+    payload = {'Resources': [f'{i:08x}-0f1e2d3c-4b5a6978-8796a5b4-c3d2e1f0' for i in range(resources)]}
+
+    asyncio.run(client.post_tools_bulk_delete(payload))
+
+    (request,) = requests
+    content = request.content
+    if compressed:
+        assert request.headers['Content-Encoding'] == 'gzip'
+        content = gzip.decompress(content)
+    else:
+        assert 'Content-Encoding' not in request.headers
+    assert json.loads(content) == payload
+
+
+def test_post_tools_bulk_content_cache():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[{'ID': 'id'}])
+
+    async def run(client):
+        return [
+            await client.post_tools_bulk_content({'Resources': ['id']}),
+            await client.post_tools_bulk_content({'Resources': ['id']}),
+            await client.post_tools_bulk_content({'Resources': ['other']}),
+        ]
+
+    assert asyncio.run(run(make_mock_client(handler, cache_ttl=60))) == [[{'ID': 'id'}]] * 3
+    assert len(requests) == 2
+
+    requests.clear()
+    asyncio.run(run(make_mock_client(handler)))
+    assert len(requests) == 3
+
+    # Payloads that cannot be used as cache keys are sent without the cache
+    requests.clear()
+    client = make_mock_client(handler, cache_ttl=60)
+    for _ in range(2):
+        asyncio.run(client.post_tools_bulk_content({'Resources': ['id'], 1: 'x'}))
+    assert len(requests) == 2
+
+
+def test_json_encoding_and_decoding():
+    bodies = []
+    large_answer = [{'ID': f'{i:040x}', 'Type': 'Study'} for i in range(10000)]  # Decoded in a thread
+
+    def handler(request):
+        bodies.append(request.content)
+        return httpx.Response(200, json=large_answer)
+
+    client = make_mock_client(handler)
+
+    async def run():
+        return [
+            await client.post_tools_find({'Level': 'Study', 'Query': {'PatientName': 'Ünïcode'}}),
+            await client.post_tools_find({1: 'non-string key'}),
+        ]
+
+    assert asyncio.run(run()) == [large_answer, large_answer]
+    assert json.loads(bodies[0]) == {'Level': 'Study', 'Query': {'PatientName': 'Ünïcode'}}
+    assert json.loads(bodies[1]) == {'1': 'non-string key'}
+
+
+def test_get_pool_stats():
+    stats = []
+
+    async def run():
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, json=[])
+
+        client = make_mock_client(handler, pool_size=2)
+        stats.append(client.get_pool_stats())
+
+        tasks = [asyncio.ensure_future(client.get_patients(params={'since': i})) for i in range(3)]
+        await asyncio.sleep(0.01)
+        stats.append(client.get_pool_stats())
+
+        release.set()
+        await asyncio.gather(*tasks)
+        stats.append(client.get_pool_stats())
+
+    asyncio.run(run())
+
+    assert stats == [
+        {'in_flight': 0, 'max_connections': 2, 'queued': 0},
+        {'in_flight': 3, 'max_connections': 2, 'queued': 1},
+        {'in_flight': 0, 'max_connections': 2, 'queued': 0},
+    ]
+
+
+def test_get_query_parameters_types():
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, json={})
+
+    client = make_mock_client(handler)
+
+    async def run():
+        for limit in [True, 1, 1.0]:
+            await client.get_changes({'limit': limit})
+
+    asyncio.run(run())
+
+    assert urls == [
+        'http://orthanc/changes?limit=true',
+        'http://orthanc/changes?limit=1',
+        'http://orthanc/changes?limit=1.0',
+    ]